@@ -0,0 +1,51 @@
+"""Sample auction frames shared by benchmark scripts"""
+
+import json
+from typing import Any, Dict
+
+
+def make_user_transaction_params(lot_id: str = "lot-1") -> Dict[str, Any]:
+    return {
+        "lotId": lot_id,
+        "txn": {
+            "from": "0x" + "11" * 20,
+            "to": "0x" + "22" * 20,
+            "value": "0x0",
+            "input": "0x" + "ab" * 200,
+        },
+        "logs": [
+            {
+                "address": "0x" + "33" * 20,
+                "topics": ["0x" + "44" * 32] * 3,
+                "data": "0x" + "55" * 64,
+            }
+        ]
+        * 4,
+        "minDeadline": 1700000000,
+        "swapInfo": {
+            "tokenIn": "0x" + "66" * 20,
+            "tokenOut": "0x" + "77" * 20,
+            "amountIn": "0x1000",
+            "nativeIn": False,
+        },
+    }
+
+
+def make_user_transaction_frame(lot_id: str = "lot-1") -> str:
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "method": "user_transaction",
+            "params": make_user_transaction_params(lot_id),
+        }
+    )
+
+
+def make_response_frame(req_id: Any = 1) -> str:
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": req_id,
+            "result": {"verificationResult": {"verified": True}},
+        }
+    )
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Cost of JSON codecs on the bid critical path
+
+For every installed codec measures encoding of make_bid request and decoding
+of user_transaction frame into SearcherInfo.
+
+Usage: python -m benchmarks.bench_codec [--number N]
+"""
+
+import argparse
+import timeit
+from typing import Callable
+
+from benchmarks._samples import make_user_transaction_frame
+from searcher_sdk.codec import available_codecs
+from searcher_sdk.jsonrpc import JSONRPCNotification, JSONRPCRequest, MessageDecoder
+from searcher_sdk.models import (
+    MakeBidParam,
+    SearcherInfoWithTraceContext,
+    SearcherRequest,
+)
+
+
+def _usec(func: Callable[[], object], number: int) -> float:
+    func()  # warm up
+    return timeit.timeit(func, number=number) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    request = JSONRPCRequest(
+        id=1,
+        method="make_bid",
+        params=MakeBidParam(
+            lot_id="lot-1",
+            searcher_request=SearcherRequest(
+                to="0x" + "11" * 20,
+                gas=1_000_000,
+                nonce=2**255,
+                data="0x" + "ab" * 68,
+                bid=10**15,
+                user_call_hash="0x" + "22" * 32,
+                max_gas_price=5 * 10**9,
+                deadline=1_700_000_000,
+            ),
+            searcher_signature="0x" + "33" * 65,
+        ),
+    )
+    frame = make_user_transaction_frame()
+
+    print(f"{'codec':<10}{'encode make_bid, us':>22}{'decode SearcherInfo, us':>26}")
+    for name, codec_class in available_codecs().items():
+        codec = codec_class()
+        decoder = MessageDecoder(codec)
+
+        def decode() -> SearcherInfoWithTraceContext:
+            message = decoder.decode(frame)
+            assert isinstance(message, JSONRPCNotification)
+            return SearcherInfoWithTraceContext.model_validate(message.params)
+
+        encode_us = _usec(lambda: codec.dumps_model(request), args.number)
+        decode_us = _usec(decode, args.number)
+        print(f"{name:<10}{encode_us:>22.2f}{decode_us:>26.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Messages per second of JSON-RPC frame decoding
+
+Compares building TypeAdapter(AnyJsonRPCMessage) for every frame (the old
+JSONRPCClient._handle_raw_message behaviour) against MessageDecoder, which is
+created once per client and validates only the model matching frame keys.
+
+Usage: python -m benchmarks.bench_dispatch [--number N]
+"""
+
+import argparse
+import timeit
+from typing import Any, Callable
+
+from pydantic import TypeAdapter
+
+from benchmarks._samples import make_response_frame, make_user_transaction_frame
+from searcher_sdk.jsonrpc import AnyJsonRPCMessage, MessageDecoder
+
+
+def _rate(func: Callable[[], object], number: int) -> float:
+    func()  # warm up
+    return number / timeit.timeit(func, number=number)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=5_000)
+    args = parser.parse_args()
+
+    decoder = MessageDecoder()
+    cached_adapter: "TypeAdapter[Any]" = TypeAdapter(AnyJsonRPCMessage)
+    frames = {
+        "user_transaction": make_user_transaction_frame(),
+        "response": make_response_frame(),
+    }
+    print(f"{'frame':<18}{'variant':<28}{'msg/s':>12}")
+    for name, frame in frames.items():
+        variants = {
+            "TypeAdapter per frame": lambda: TypeAdapter(
+                AnyJsonRPCMessage
+            ).validate_json(frame),
+            "cached union TypeAdapter": lambda: cached_adapter.validate_json(frame),
+            "MessageDecoder": lambda: decoder.decode(frame),
+        }
+        for variant, func in variants.items():
+            # Building adapters is slow, so keep the per-frame variant short
+            number = args.number // 10 if "per frame" in variant else args.number
+            print(f"{name:<18}{variant:<28}{_rate(func, number):>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Simulation of lots meeting their deadlines with FIFO and EDF scheduling
+
+Lots arrive in random bursts, each with its own min_deadline, and a single
+strategy worker spends a fixed time on each of them. Simulation runs in
+virtual time through LotQueue, and reports how many lots were processed
+before their deadline for each scheduling mode.
+
+Usage: python -m benchmarks.bench_edf [--lots N] [--seed S]
+"""
+
+import argparse
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import List, Tuple
+
+from searcher_sdk.queues import LotQueue, LotQueueConfig, Scheduling
+
+
+@dataclass
+class SimLot:
+    arrival: float
+    min_deadline: float
+
+
+def _generate_lots(
+    count: int,
+    rng: random.Random,
+    burst_interval: float,
+    max_burst: int,
+    slack: Tuple[float, float],
+) -> List[SimLot]:
+    lots: List[SimLot] = []
+    now = 0.0
+    while len(lots) < count:
+        now += rng.expovariate(1 / burst_interval)
+        for _ in range(rng.randint(1, max_burst)):
+            lots.append(SimLot(arrival=now, min_deadline=now + rng.uniform(*slack)))
+    return lots[:count]
+
+
+async def _simulate(
+    lots: List[SimLot], config: LotQueueConfig, service_time: float
+) -> Tuple[int, int]:
+    """Returns number of lots that met deadline and number of skipped lots"""
+    now = 0.0
+    queue: LotQueue[SimLot] = LotQueue(config, clock=lambda: now)
+    met = 0
+    pending = iter(lots)
+    next_lot = next(pending, None)
+    while True:
+        while next_lot is not None and next_lot.arrival <= now:
+            await queue.put(next_lot)
+            next_lot = next(pending, None)
+        try:
+            lot = queue.get_nowait()
+        except asyncio.QueueEmpty:
+            if next_lot is None:
+                break
+            now = next_lot.arrival
+            continue
+        now += service_time
+        met += now <= lot.min_deadline
+    return met, queue.stats.expired
+
+
+async def main(count: int, seed: int) -> None:
+    lots = _generate_lots(
+        count,
+        random.Random(seed),
+        burst_interval=0.3,
+        max_burst=20,
+        slack=(0.05, 1.0),
+    )
+    variants = {
+        "FIFO": LotQueueConfig(),
+        "FIFO + drop expired": LotQueueConfig(drop_expired=True),
+        "EDF": LotQueueConfig(scheduling=Scheduling.EDF),
+        "EDF + drop expired": LotQueueConfig(
+            scheduling=Scheduling.EDF, drop_expired=True
+        ),
+    }
+    print(f"{count} lots, 20ms per lot, bursts of 1-20 lots every ~300ms")
+    print(f"{'scheduling':<22}{'met deadline':>14}{'%':>8}{'skipped':>10}")
+    for name, config in variants.items():
+        met, skipped = await _simulate(lots, config, service_time=0.02)
+        print(f"{name:<22}{met:>14}{met / count:>8.1%}{skipped:>10}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--lots", type=int, default=100_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+    asyncio.run(main(args.lots, args.seed))
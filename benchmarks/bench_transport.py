@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Request round trip latency with and without permessage-deflate
+
+Runs a local websocket server that answers every JSON-RPC request with
+a lot-sized result, and measures send_request round trips through
+JSONRPCClient for each TransportConfig variant.
+
+Usage: python -m benchmarks.bench_transport [--requests N]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List
+
+from websockets.client import connect
+from websockets.legacy.server import WebSocketServerProtocol, serve
+
+from benchmarks._samples import make_user_transaction_params
+from searcher_sdk.jsonrpc import JSONRPCClient
+from searcher_sdk.models import SearcherInfo
+from searcher_sdk.transport import TransportConfig
+
+
+async def _handler(ws: WebSocketServerProtocol) -> None:
+    result = make_user_transaction_params()
+    async for raw in ws:
+        request = json.loads(raw)
+        await ws.send(
+            json.dumps({"jsonrpc": "2.0", "id": request["id"], "result": result})
+        )
+
+
+async def _measure(url: str, config: TransportConfig, requests: int) -> List[float]:
+    info = SearcherInfo.model_validate(make_user_transaction_params())
+    client = JSONRPCClient()
+    latencies = []
+    async with connect(url, **config.connect_kwargs()) as ws:
+        config.configure_socket(ws)
+        async with client.listen(ws):
+            for _ in range(requests):
+                start = time.perf_counter()
+                await client.send_request("echo", info)
+                latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+async def main(requests: int) -> None:
+    variants: Dict[str, TransportConfig] = {
+        "no compression": TransportConfig(compression=None),
+        "deflate": TransportConfig(compression="deflate"),
+    }
+    async with serve(_handler, "127.0.0.1", 0) as server:
+        port = next(iter(server.sockets)).getsockname()[1]
+        url = f"ws://127.0.0.1:{port}"
+        print(f"{'variant':<16}{'p50, us':>10}{'p99, us':>10}{'mean, us':>10}")
+        for name, config in variants.items():
+            await _measure(url, config, requests // 10)  # warm up
+            latencies = sorted(await _measure(url, config, requests))
+            p50 = latencies[len(latencies) // 2] * 1e6
+            p99 = latencies[int(len(latencies) * 0.99)] * 1e6
+            mean = statistics.mean(latencies) * 1e6
+            print(f"{name:<16}{p50:>10.0f}{p99:>10.0f}{mean:>10.0f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
@@ -2,7 +2,6 @@
 import dataclasses
 import logging
 import secrets
-from datetime import datetime, timedelta
 from typing import Optional
 
 import click
@@ -50,8 +49,7 @@ class SimpleSearcher(CLISearcher[SimpleSearcherConfig]):
                 info
             ),  # Hash of user transaction for searchers safety
             deadline=(  # Timestamp, time until this searcher request is valid
-                info.min_deadline
-                or int((datetime.now() + timedelta(seconds=30)).timestamp())
+                info.min_deadline or int(self._client.server_time()) + 30
             ),
             gas=1_000_000,  # Amount of gas searcher contract may use
             max_gas_price=5 * denoms.gwei,  # Max price searcher contract accepts.
@@ -9,10 +9,13 @@ from searcher_sdk.models import (
 )
 
 from .cli import BaseSearcherConfig, CLISearcher
+from .multi import FailoverAuctionClient, RedundantAuctionClient
 from .utils import sign_searcher_request, user_tx_hash
 
 __all__ = [
     "AuctionClient",
+    "RedundantAuctionClient",
+    "FailoverAuctionClient",
     "SearcherInfo",
     "SearcherRequest",
     "BidData",
@@ -1,5 +1,7 @@
 import abc
 import asyncio
+import datetime
+import functools
 import logging
 from dataclasses import dataclass
 from typing import Any, Callable, ClassVar, Generic, Optional, Sequence, Type, TypeVar
@@ -15,7 +17,9 @@ from searcher_sdk.models import (
     SearcherRequest,
     SignatureDomainInfo,
 )
-from searcher_sdk.utils import sign_searcher_request
+from searcher_sdk.multi import RedundantAuctionClient
+from searcher_sdk.supervisor import LotSupervisor
+from searcher_sdk.utils import Backoff, sign_searcher_request
 
 logger = logging.getLogger()
 
@@ -42,11 +46,32 @@ class CLISearcher(abc.ABC, Generic[CONFIG]):
         config: CONFIG,
         max_reconnects: int,
         reconnect_timeout: int,
+        stable_period: datetime.timedelta = datetime.timedelta(minutes=5),
+        concurrency: int = 16,
     ) -> None:
         self._client = client
         self._config = config
         self._max_reconnects = max_reconnects
         self._reconnect_timeout = reconnect_timeout
+        self._backoff = Backoff(maximum=reconnect_timeout)
+        # Connection that lived this long resets reconnect counter
+        self._stable_period = stable_period
+        self._concurrency = concurrency
+        self._supervisor: Optional[LotSupervisor] = None
+
+    @property
+    def queued_lots(self) -> int:
+        """Number of received lots waiting for a free processing slot"""
+        return self._client.queued_lots if self._client.connected else 0
+
+    @property
+    def lots_in_flight(self) -> int:
+        return self._supervisor.in_flight if self._supervisor else 0
+
+    @property
+    def timed_out_lots(self) -> int:
+        """Number of lots cancelled because their deadline has passed"""
+        return self._supervisor.timed_out if self._supervisor else 0
 
     @abc.abstractmethod
     async def _make_searcher_request(
@@ -55,22 +80,37 @@ class CLISearcher(abc.ABC, Generic[CONFIG]):
         pass
 
     async def _run_with_retries(self) -> None:
-        for i in range(self._max_reconnects):
+        loop = asyncio.get_event_loop()
+        failures = 0
+        while failures < self._max_reconnects:
+            started = loop.time()
             try:
                 await self.run_forever()
             except Exception as e:
                 logger.exception(e)
+            if loop.time() - started >= self._stable_period.total_seconds():
+                failures = 0
+            delay = self._backoff.delay(failures)
+            failures += 1
             logger.warning(
-                f"Used {i + 1} connect tries. "
-                f"Reconnecting in {self._reconnect_timeout} seconds"
+                f"Used {failures} connect tries. Reconnecting in {delay:.2f} seconds"
             )
-            await asyncio.sleep(self._reconnect_timeout)
+            await asyncio.sleep(delay)
 
     async def run_forever(self) -> None:
         logger.info("Starting listening for lots indefinitely")
-        async with self._client:
-            async for info in self._client.listen_as_iter():
-                asyncio.create_task(self._on_searcher_info_wrapper(info))
+        supervisor = LotSupervisor(self._concurrency, clock=self._client.server_time)
+        self._supervisor = supervisor
+        try:
+            async with self._client:
+                async for info in self._client.listen_as_iter():
+                    await supervisor.submit(
+                        info.min_deadline,
+                        functools.partial(self._on_searcher_info_wrapper, info),
+                    )
+        finally:
+            # Bids of unfinished lots would go to the connection that is gone
+            await supervisor.drain(timeout=0)
 
     async def _on_searcher_info_wrapper(
         self, info: SearcherInfoWithTraceContext
@@ -96,7 +136,7 @@ class CLISearcher(abc.ABC, Generic[CONFIG]):
                 private_key_hex=self._config.private_key_hex,
             ),
         )
-        result = await self._client.make_bid(info.lot_id, bid_data)
+        result = await self._client.make_bid(info.lot_id, bid_data, info.min_deadline)
         logger.info(f"Got make bid result: {result}")
 
     @classmethod
@@ -149,16 +189,37 @@ class CLISearcher(abc.ABC, Generic[CONFIG]):
         )
         @click.option(
             "--max-reconnects",
-            help="Maximum number of reconnects before process exists",
+            help=(
+                "Maximum number of consecutive failed reconnects "
+                "before process exits"
+            ),
             type=int,
             default=10,
         )
         @click.option(
             "--reconnect-timeout",
-            help="Wait this many seconds before reconnecting",
+            help=(
+                "Maximum wait in seconds before reconnecting. Waits grow "
+                "exponentially with jitter up to this value"
+            ),
             type=int,
             default=5,
         )
+        @click.option(
+            "--concurrency",
+            help="Maximum number of lots processed at the same time",
+            type=int,
+            default=16,
+        )
+        @click.option(
+            "--hot-standby",
+            help=(
+                "Keep a second connection to auction open, so lots keep coming "
+                "through it while broken connection is reopened"
+            ),
+            is_flag=True,
+            default=False,
+        )
         def start_searcher(
             auction_url: str,
             auction_token: str,
@@ -169,6 +230,8 @@ class CLISearcher(abc.ABC, Generic[CONFIG]):
             otel_exporter_otlp_endpoint: Optional[str],
             max_reconnects: int,
             reconnect_timeout: int,
+            concurrency: int,
+            hot_standby: bool,
             **kwargs: Any,
         ) -> None:
             """Start searcher for Wallchain MEV auction"""
@@ -189,8 +252,19 @@ class CLISearcher(abc.ABC, Generic[CONFIG]):
                     )
                 )
 
+            client: AuctionClient
+            if hot_standby:
+                client = RedundantAuctionClient(
+                    [auction_url],
+                    auction_token,
+                    connections_per_url=2,
+                    backoff=Backoff(maximum=reconnect_timeout),
+                )
+            else:
+                client = AuctionClient(auction_url, auction_token)
+
             searcher = cls(
-                client=AuctionClient(auction_url, auction_token),
+                client=client,
                 config=cls.config_class(
                     domain_info=SignatureDomainInfo(
                         chain_id=chain_id,
@@ -201,6 +275,7 @@ class CLISearcher(abc.ABC, Generic[CONFIG]):
                 ),
                 max_reconnects=max_reconnects,
                 reconnect_timeout=reconnect_timeout,
+                concurrency=concurrency,
             )
 
             asyncio.run(searcher._run_with_retries())
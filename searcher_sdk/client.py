@@ -1,12 +1,27 @@
 import asyncio
 import datetime
+import functools
 import logging
+import statistics
+import time
 from contextlib import AsyncExitStack
-from typing import Any, AsyncIterator, Awaitable, Callable, Optional, Set
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Optional,
+    Set,
+    Union,
+)
 
 from websockets.client import connect
+from websockets.legacy.client import WebSocketClientProtocol
 
-from searcher_sdk.jsonrpc import JSONRPCClient
+from searcher_sdk.clock import ClockOffsetEstimator, ServerClock
+from searcher_sdk.codec import JSONCodec, get_codec
+from searcher_sdk.jsonrpc import DispatchConfig, JSONRPCClient
 from searcher_sdk.models import (
     BidData,
     MakeBidParam,
@@ -14,6 +29,15 @@ from searcher_sdk.models import (
     SearcherInfo,
     SearcherInfoWithTraceContext,
 )
+from searcher_sdk.queues import LotQueue, LotQueueConfig, LotQueueStats
+from searcher_sdk.supervisor import LotSupervisor
+from searcher_sdk.telemetry import (
+    AdaptivePingInterval,
+    PingMode,
+    RttHistogram,
+    TimeoutPolicy,
+)
+from searcher_sdk.transport import TransportConfig
 from searcher_sdk.utils import cancel_on_exit
 
 logger = logging.getLogger(__name__)
@@ -38,26 +62,136 @@ class AuctionClient:
         token: str,
         ping_interval: datetime.timedelta = datetime.timedelta(seconds=10),
         ping_timeout: datetime.timedelta = datetime.timedelta(seconds=5),
+        codec: Optional[JSONCodec] = None,
+        dispatch: Optional[DispatchConfig] = None,
+        transport: Optional[TransportConfig] = None,
+        lot_queue: Optional[LotQueueConfig] = None,
+        ping_mode: PingMode = PingMode.JSONRPC,
+        min_ping_interval: datetime.timedelta = datetime.timedelta(seconds=1),
+        timeout_policy: Optional[TimeoutPolicy] = None,
+        clock: Optional[ServerClock] = None,
     ) -> None:
         self._url = url
         self._token = token
+        # Pings are sent every ping_interval while RTT is stable and
+        # down to every min_ping_interval while it is degraded
         self._ping_interval = ping_interval
+        self._min_ping_interval = min_ping_interval
         self._ping_timeout = ping_timeout
+        self._ping_mode = ping_mode
+        self._rtt = RttHistogram()
+        # Without policy ping_timeout and JSONRPCClient response_timeout apply
+        self._timeout_policy = timeout_policy
+        self._clock = clock or ClockOffsetEstimator()
+        self._codec = codec or get_codec()
+        self._dispatch = dispatch
+        self._transport = transport or TransportConfig()
+        self._request_handlers: Dict[str, Callable[[Any], Awaitable[Any]]] = {}
         self._connected: bool = False
-        self._json_rpc_client = JSONRPCClient()
+        self._json_rpc_client = self._make_json_rpc_client()
         self._exit_stack = AsyncExitStack()
-        self._queue: "asyncio.Queue[SearcherInfoWithTraceContext | PingNotReceived]" = (
-            asyncio.Queue()
-        )
+        self._lot_queue_config = lot_queue or LotQueueConfig()
+        self._lot_queue_stats = LotQueueStats()
+        self._queue = self._make_lot_queue()
+
+    def on_request(self, method: str) -> Callable[[Any], Any]:
+        """Register handler for requests sent by auction
+
+        See JSONRPCClient.on_request for details. Handlers are kept across
+        reconnects.
+        """
+
+        def register(handler: Any) -> Any:
+            assert (
+                method not in self._request_handlers
+            ), f"Handler for {method} is already registered"
+            self._request_handlers[method] = handler
+            if self._connected:
+                self._json_rpc_client.on_request(method)(handler)
+            return handler
+
+        return register
+
+    @property
+    def url(self) -> str:
+        return self._url
+
+    @property
+    def connected(self) -> bool:
+        return self._connected
+
+    @property
+    def pending_requests(self) -> int:
+        """Number of requests to auction that are waiting for response"""
+        return self._json_rpc_client.pending_requests
+
+    def server_time(self) -> float:
+        """Estimated auction server time, unix timestamp
+
+        Lot deadlines are set by server clock, so compare them against this
+        rather than local time. Offset is estimated from ping responses
+        carrying server timestamp, see ClockOffsetEstimator.
+        """
+        return self._clock.now()
+
+    @property
+    def rtt(self) -> RttHistogram:
+        """Ping round trip times of current connection, in seconds"""
+        return self._rtt
+
+    @property
+    def queued_lots(self) -> int:
+        """Number of received lots waiting to be processed"""
+        return self._queue.qsize()
+
+    @property
+    def lot_queue_stats(self) -> LotQueueStats:
+        """Counters of dropped lots, kept across reconnects"""
+        return self._lot_queue_stats
 
     async def listen_lots(
-        self, bid_maker: BidMaker, result_listener: Optional[ResultListener] = None
+        self,
+        bid_maker: BidMaker,
+        result_listener: Optional[ResultListener] = None,
+        concurrency: int = 1,
+        drain_timeout: datetime.timedelta = datetime.timedelta(seconds=1),
     ) -> None:
-        async with self:  # Connect, no-op if already connected
-            async for info in self.listen_as_iter():
-                await self._process_info(info, bid_maker, result_listener)
+        """Call bid_maker for every received lot and send its bids
 
-    async def make_bid(self, lot_id: str, bid: BidData) -> MakeBidResult:
+        Up to `concurrency` lots are processed at once. Processing of a lot
+        is cancelled once its min_deadline passes. On exit lots in progress
+        are given drain_timeout to finish before they are cancelled.
+        """
+        supervisor = LotSupervisor(concurrency, clock=self.server_time)
+        try:
+            async with self:  # Connect, no-op if already connected
+                async for info in self.listen_as_iter():
+                    await supervisor.submit(
+                        info.min_deadline,
+                        functools.partial(
+                            self._process_info, info, bid_maker, result_listener
+                        ),
+                    )
+        finally:
+            await supervisor.drain(drain_timeout.total_seconds())
+
+    async def make_bid(
+        self, lot_id: str, bid: BidData, deadline: Optional[float] = None
+    ) -> MakeBidResult:
+        """Send bid for the lot
+
+        deadline is unix timestamp after which the bid is abandoned, usually
+        lot min_deadline. asyncio.TimeoutError is raised without sending
+        the bid if it has already passed.
+        """
+        timeout = self._response_timeout()
+        if deadline is not None:
+            remaining = deadline - self.server_time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError("Lot deadline has passed")
+            if timeout is None:
+                timeout = self._json_rpc_client.response_timeout
+            timeout = min(timeout, remaining)
         res = await self._json_rpc_client.send_request(
             "make_bid",
             MakeBidParam(
@@ -65,6 +199,7 @@ class AuctionClient:
                 searcher_request=bid.searcher_request,
                 searcher_signature=bid.searcher_signature,
             ),
+            timeout=timeout,
         )
         return MakeBidResult(**res)
 
@@ -77,19 +212,27 @@ class AuctionClient:
 
     async def __aenter__(self) -> "AuctionClient":
         if not self._connected:
-            self._json_rpc_client = JSONRPCClient()
+            self._json_rpc_client = self._make_json_rpc_client()
             self._exit_stack = AsyncExitStack()
-            self._queue = asyncio.Queue()
+            self._queue = self._make_lot_queue()
+            self._rtt.clear()
 
             self._json_rpc_client.on_notification("user_transaction")(self._process_lot)
             await self._exit_stack.__aenter__()
-            ws = await self._exit_stack.enter_async_context(
-                connect(self._url + f"/broadcaster/listen?token={self._token}")
-            )
-            await self._exit_stack.enter_async_context(self._json_rpc_client.listen(ws))
-            await self._exit_stack.enter_async_context(
-                cancel_on_exit(self._ping_loop())
-            )
+            try:
+                ws = await self._exit_stack.enter_async_context(
+                    connect(self._listen_url(), **self._transport.connect_kwargs())
+                )
+                self._transport.configure_socket(ws)
+                await self._exit_stack.enter_async_context(
+                    self._json_rpc_client.listen(ws)
+                )
+                await self._exit_stack.enter_async_context(
+                    cancel_on_exit(self._ping_loop(ws))
+                )
+            except BaseException:
+                await self._exit_stack.aclose()
+                raise
             self._connected = True
         return self
 
@@ -99,20 +242,57 @@ class AuctionClient:
         finally:
             self._connected = False
 
-    async def _ping_loop(self) -> None:
+    def _listen_url(self) -> str:
+        return self._url + f"/broadcaster/listen?token={self._token}"
+
+    async def _probe_rtt(self, pings: int) -> float:
+        """Median RTT of websocket pings over a separate short-lived connection"""
+        loop = asyncio.get_event_loop()
+        rtts = []
+        async with connect(
+            self._listen_url(), **self._transport.connect_kwargs()
+        ) as ws:
+            for _ in range(pings):
+                started = loop.time()
+                await asyncio.wait_for(
+                    self._ping_frame(ws), timeout=self._ping_timeout.total_seconds()
+                )
+                rtts.append(loop.time() - started)
+        return statistics.median(rtts)
+
+    def _make_lot_queue(
+        self,
+    ) -> "LotQueue[Union[SearcherInfoWithTraceContext, PingNotReceived]]":
+        return LotQueue(
+            self._lot_queue_config, self._lot_queue_stats, clock=self.server_time
+        )
+
+    def _make_json_rpc_client(self) -> JSONRPCClient:
+        json_rpc_client = JSONRPCClient(codec=self._codec, dispatch=self._dispatch)
+        for method, handler in self._request_handlers.items():
+            json_rpc_client.on_request(method)(handler)
+        return json_rpc_client
+
+    async def _ping_loop(self, ws: WebSocketClientProtocol) -> None:
+        loop = asyncio.get_event_loop()
+        interval = AdaptivePingInterval(
+            self._min_ping_interval.total_seconds(),
+            self._ping_interval.total_seconds(),
+        )
         while True:
             try:
                 logger.info("Sending ping")
-                res = await asyncio.wait_for(
-                    self._json_rpc_client.send_request("ping"),
-                    timeout=self._ping_timeout.total_seconds(),
-                )
-                logger.info("Got pong")
+                started, sent = loop.time(), time.time()
+                timeout = self._response_timeout()
+                if timeout is None:
+                    timeout = self._ping_timeout.total_seconds()
+                server_time = await asyncio.wait_for(self._ping(ws), timeout=timeout)
+                rtt = loop.time() - started
             except asyncio.TimeoutError:
                 await self._queue.put(
                     PingNotReceived(
                         f"Broken connection: did not received ping in "
-                        f"{self._ping_timeout.total_seconds()} seconds"
+                        f"{timeout:.3f} seconds"
                     )
                 )
                 return
@@ -121,9 +301,32 @@ class AuctionClient:
                     PingNotReceived(f"Broken connection: failed to send ping")
                 )
                 return
-            if res != "pong":
-                logger.warning(f"Wrong ping response: {res}")
-            await asyncio.sleep(self._ping_interval.total_seconds())
+            self._rtt.record(rtt)
+            if server_time is not None:
+                self._clock.record(sent, server_time, time.time())
+            logger.info(f"Got pong in {rtt * 1000:.1f} ms")
+            await asyncio.sleep(interval.next(self._rtt))
+
+    async def _ping_frame(self, ws: WebSocketClientProtocol) -> None:
+        pong_waiter = await ws.ping()
+        await pong_waiter
+
+    def _response_timeout(self) -> Optional[float]:
+        if self._timeout_policy is None:
+            return None
+        return self._timeout_policy.timeout(self._rtt)
+
+    async def _ping(self, ws: WebSocketClientProtocol) -> Optional[float]:
+        """Returns server timestamp if server reported it"""
+        if self._ping_mode is PingMode.WEBSOCKET:
+            await self._ping_frame(ws)
+            return None
+        res = await self._json_rpc_client.send_request("ping")
+        if isinstance(res, dict) and isinstance(res.get("timestamp"), (int, float)):
+            return float(res["timestamp"])
+        if res != "pong":
+            logger.warning(f"Wrong ping response: {res}")
+        return None
 
     async def _process_lot(self, info: SearcherInfoWithTraceContext) -> None:
         await self._queue.put(info)
@@ -139,7 +342,7 @@ class AuctionClient:
                 bid = await bid_maker(SearcherInfo(**info.model_dump()))
                 if bid is None:
                     return
-                result = await self.make_bid(info.lot_id, bid)
+                result = await self.make_bid(info.lot_id, bid, info.min_deadline)
                 if result_listener:
                     await result_listener(result)
         except Exception:
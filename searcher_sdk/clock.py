@@ -0,0 +1,64 @@
+import abc
+import time
+from collections import deque
+from typing import Callable, Deque, Tuple
+
+
+class ServerClock(abc.ABC):
+    """Auction server time as seen from this host"""
+
+    @abc.abstractmethod
+    def now(self) -> float:
+        """Current server time, unix timestamp"""
+
+    def record(self, sent: float, server_time: float, received: float) -> None:
+        """Feed timestamp reported by server during a round trip
+
+        sent and received are local unix timestamps of request and response.
+        """
+
+
+class LocalClock(ServerClock):
+    """Assumes server clock matches local one"""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+
+    def now(self) -> float:
+        return self._clock()
+
+
+class ClockOffsetEstimator(ServerClock):
+    """NTP-style estimate of server clock offset
+
+    Server timestamp is assumed to be taken halfway through the round trip.
+    Of the last `window` samples the one with the shortest round trip is
+    trusted, as queueing delays make the halfway assumption least accurate
+    for slow round trips. Until first sample offset is zero.
+    """
+
+    def __init__(
+        self, window: int = 32, clock: Callable[[], float] = time.time
+    ) -> None:
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=window)
+        self._clock = clock
+        self._offset = 0.0
+
+    @property
+    def offset(self) -> float:
+        """Seconds to add to local time to get server time"""
+        return self._offset
+
+    @property
+    def samples(self) -> int:
+        return len(self._samples)
+
+    def now(self) -> float:
+        return self._clock() + self._offset
+
+    def record(self, sent: float, server_time: float, received: float) -> None:
+        delay = received - sent
+        if delay < 0:
+            return
+        self._samples.append((delay, server_time - (sent + received) / 2))
+        self._offset = min(self._samples)[1]
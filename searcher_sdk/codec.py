@@ -0,0 +1,102 @@
+import abc
+import json
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, Union
+
+from pydantic import BaseModel
+
+
+class JSONCodec(abc.ABC):
+    """Encodes and decodes JSON-RPC frames
+
+    Frames are always encoded to str, as auction expects text websocket frames.
+    """
+
+    name: ClassVar[str]
+
+    @abc.abstractmethod
+    def loads(self, raw: Union[str, bytes]) -> Any:
+        pass
+
+    @abc.abstractmethod
+    def dumps(self, obj: Any) -> str:
+        pass
+
+    def dumps_model(self, model: BaseModel) -> str:
+        # pydantic serializes models in Rust, which is faster than
+        # model_dump() followed by dumps() with any of supported backends
+        return model.model_dump_json(by_alias=True)
+
+
+class StdlibCodec(JSONCodec):
+    name = "json"
+
+    def loads(self, raw: Union[str, bytes]) -> Any:
+        return json.loads(raw)
+
+    def dumps(self, obj: Any) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+        self._dumps: Callable[[Any], bytes] = orjson.dumps
+
+    def loads(self, raw: Union[str, bytes]) -> Any:
+        return self._loads(raw)
+
+    def dumps(self, obj: Any) -> str:
+        return self._dumps(obj).decode()
+
+
+class MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, raw: Union[str, bytes]) -> Any:
+        return self._decoder.decode(raw)
+
+    def dumps(self, obj: Any) -> str:
+        return self._encoder.encode(obj).decode()
+
+
+# In order of preference
+_CODECS: List[Type[JSONCodec]] = [OrjsonCodec, MsgspecCodec, StdlibCodec]
+
+
+def available_codecs() -> Dict[str, Type[JSONCodec]]:
+    res = {}
+    for codec_class in _CODECS:
+        try:
+            codec_class()
+        except ImportError:
+            continue
+        res[codec_class.name] = codec_class
+    return res
+
+
+def get_codec(name: Optional[str] = None) -> JSONCodec:
+    """Create codec by name, or fastest installed one if name is not given
+
+    Install searcher-sdk[fast] to get orjson backend.
+    """
+    for codec_class in _CODECS:
+        if name is not None and codec_class.name != name:
+            continue
+        try:
+            return codec_class()
+        except ImportError:
+            if name is not None:
+                raise ValueError(
+                    f"JSON codec {name!r} requires {name} package to be installed"
+                )
+    raise ValueError(f"Unknown JSON codec {name!r}")
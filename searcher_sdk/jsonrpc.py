@@ -2,15 +2,30 @@ import asyncio
 import datetime
 import enum
 import inspect
+import itertools
 import logging as L
-import secrets
 from collections import defaultdict
-from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Union
-
-from pydantic import BaseModel, TypeAdapter
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
 from websockets.legacy.client import WebSocketClientProtocol
 
+from searcher_sdk.codec import JSONCodec, get_codec
+from searcher_sdk.queues import BoundedQueue, OverflowPolicy
 from searcher_sdk.utils import cancel_on_exit
 
 logger = L.getLogger(__name__)
@@ -22,7 +37,7 @@ IdType = Union[str, int, float]
 class JSONRPCNotification(BaseModel):
     jsonrpc: str = "2.0"
     method: str
-    params: Optional[Any]
+    params: Optional[Any] = None
 
 
 class JSONRPCRequest(BaseModel):
@@ -50,11 +65,66 @@ class JSONRPCErrorResponse(BaseModel):
     error: JSONRPCError
 
 
+class JSONRPCCallError(Exception):
+    """Raised from send_request when server responds with JSON-RPC error"""
+
+    def __init__(self, code: int, message: str, data: Optional[Any] = None) -> None:
+        super().__init__(f"JSON-RPC error {code}: {message}")
+        self.code = code
+        self.message = message
+        self.data = data
+
+    @classmethod
+    def from_error(cls, error: JSONRPCError) -> "JSONRPCCallError":
+        return cls(code=error.code, message=error.message, data=error.data)
+
+
 AnyJsonRPCMessage = Union[
     JSONRPCNotification, JSONRPCRequest, JSONRPCResponse, JSONRPCErrorResponse
 ]
 
 
+class MessageDecoder:
+    """Decodes raw websocket frames into JSON-RPC messages
+
+    Message kind is detected by the keys present in the object, so only
+    matching model is validated instead of trying every member
+    of AnyJsonRPCMessage. Batch (array) frames are decoded into several
+    messages, invalid batch members are skipped.
+    """
+
+    def __init__(self, codec: Optional[JSONCodec] = None) -> None:
+        self._codec = codec or get_codec()
+
+    def decode(self, raw: Union[str, bytes]) -> List[AnyJsonRPCMessage]:
+        data = self._codec.loads(raw)
+        if isinstance(data, dict):
+            return [self.decode_object(data)]
+        if not isinstance(data, list) or not data:
+            raise ValueError("JSON-RPC message should be an object or non-empty array")
+        messages = []
+        for item in data:
+            try:
+                if not isinstance(item, dict):
+                    raise ValueError("JSON-RPC message should be an object")
+                messages.append(self.decode_object(item))
+            except ValueError:
+                logger.warning(f"Got invalid json-rpc message in batch: {item!r}")
+        return messages
+
+    def decode_object(self, data: Dict[str, Any]) -> AnyJsonRPCMessage:
+        model: Type[AnyJsonRPCMessage]
+        if "method" in data:
+            model = JSONRPCRequest if "id" in data else JSONRPCNotification
+        elif "error" in data:
+            model = JSONRPCErrorResponse
+        elif "result" in data:
+            model = JSONRPCResponse
+        else:
+            raise ValueError("Unknown JSON-RPC message kind")
+        return model.model_validate(data)
+
+
 class ErrorCodes(enum.Enum):
     """JSON-RPC 2.0 error codes
 
@@ -64,7 +134,8 @@ class ErrorCodes(enum.Enum):
     PARSE_ERROR = -32700
     INVALID_REQUEST = -32600
     METHOD_NOT_FOUND = -32601
-    INVALID_PARAMS = -32601
+    INVALID_PARAMS = -32602
+    INTERNAL_ERROR = -32603
     SERVER_ERROR = -32000
 
 
@@ -96,14 +167,83 @@ class RpcMethod(BaseModel):
             raise Exception("Unsupported input type")
 
 
+class RequestTable:
+    """Futures of sent requests that are waiting for response
+
+    Ids are monotonic integers, so they never collide within a connection.
+    Entries should be removed with discard() once caller stops waiting, even
+    when response was never received.
+    """
+
+    def __init__(self) -> None:
+        self._ids = itertools.count(1)
+        self._futures: Dict[IdType, "asyncio.Future[Any]"] = {}
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def create(self) -> Tuple[int, "asyncio.Future[Any]"]:
+        req_id = next(self._ids)
+        future: "asyncio.Future[Any]" = asyncio.get_event_loop().create_future()
+        self._futures[req_id] = future
+        return req_id, future
+
+    def pop(self, req_id: Optional[IdType]) -> "Optional[asyncio.Future[Any]]":
+        if req_id is None:
+            return None
+        return self._futures.pop(req_id, None)
+
+    def discard(self, req_id: Optional[IdType]) -> None:
+        self.pop(req_id)
+
+    def fail_all(self, exc: BaseException) -> None:
+        futures = list(self._futures.values())
+        self._futures.clear()
+        for future in futures:
+            if not future.done():
+                future.set_exception(exc)
+
+
+@dataclass
+class DispatchConfig:
+    """Limits for handling of incoming notifications and requests
+
+    They are processed by at most max_in_flight worker tasks, and up to
+    queue_size of them wait in a queue, after that overflow policy applies.
+    With OverflowPolicy.BLOCK reading from the socket stops until queue has
+    free space. Responses to our requests skip the queue and are resolved
+    as soon as they are read.
+    """
+
+    max_in_flight: int = 64
+    queue_size: int = 1024
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK
+
+
 class JSONRPCClient:
     def __init__(
-        self, response_timeout: datetime.timedelta = datetime.timedelta(seconds=10)
+        self,
+        response_timeout: datetime.timedelta = datetime.timedelta(seconds=10),
+        codec: Optional[JSONCodec] = None,
+        dispatch: Optional[DispatchConfig] = None,
     ) -> None:
         self._ws: Optional[WebSocketClientProtocol] = None
-        self._res_futures: Dict[IdType, "asyncio.Future[Any]"] = {}
+        self._requests = RequestTable()
         self._notification_listeners: Dict[str, List[RpcMethod]] = defaultdict(list)
+        self._request_handlers: Dict[str, RpcMethod] = {}
         self._response_timeout = response_timeout
+        self._codec = codec or get_codec()
+        self._decoder = MessageDecoder(self._codec)
+        self._message_handlers: Dict[type, Callable[[Any], Awaitable[None]]] = {
+            JSONRPCNotification: self._handle_notification,
+            JSONRPCRequest: self._handle_request,
+            JSONRPCResponse: self._handle_response,
+            JSONRPCErrorResponse: self._handle_error,
+        }
+        self._dispatch = dispatch or DispatchConfig()
+        self._dispatch_queue: BoundedQueue[AnyJsonRPCMessage] = BoundedQueue(
+            self._dispatch.queue_size, self._dispatch.overflow
+        )
 
     def on_notification(self, method: str) -> Callable[[Any], Any]:
         def register(listener: Any) -> Any:
@@ -114,30 +254,119 @@ class JSONRPCClient:
 
         return register
 
+    def on_request(self, method: str) -> Callable[[Any], Any]:
+        """Register handler for requests sent by server
+
+        Handler return value is sent back as the result. To respond with
+        a specific JSON-RPC error, handler should raise JSONRPCCallError,
+        any other exception is reported as server error.
+        """
+
+        def register(handler: Any) -> Any:
+            assert (
+                method not in self._request_handlers
+            ), f"Handler for {method} is already registered"
+            self._request_handlers[method] = RpcMethod.from_function(handler)
+            return handler
+
+        return register
+
+    @property
+    def response_timeout(self) -> float:
+        return self._response_timeout.total_seconds()
+
+    @property
+    def pending_requests(self) -> int:
+        """Number of sent requests that are waiting for response"""
+        return len(self._requests)
+
+    @property
+    def queued_messages(self) -> int:
+        """Number of incoming messages waiting for a dispatch worker"""
+        return self._dispatch_queue.qsize()
+
+    @property
+    def dropped_messages(self) -> int:
+        """Number of incoming messages dropped due to dispatch queue overflow"""
+        return self._dispatch_queue.dropped
+
     async def send_request(
         self,
         method: str,
         params: Optional[BaseModel] = None,
+        timeout: Optional[float] = None,
     ) -> Any:
+        """Send request and wait for its result
+
+        timeout is in seconds, response_timeout is used if it is not set.
+        """
         assert self._ws, "listen() should be called before using send_request"
-        req_id = secrets.token_hex(4)
+        req, future = self._new_request(method, params)
+        try:
+            await self._ws.send(self._codec.dumps_model(req))
+        except BaseException:
+            self._requests.discard(req.id)
+            raise
+        return await self._wait_response(req.id, future, timeout)
+
+    async def send_batch(
+        self, calls: Sequence[Tuple[str, Optional[BaseModel]]]
+    ) -> List["asyncio.Future[Any]"]:
+        """Send several requests in a single JSON-RPC batch frame
+
+        Returns one future per call, in the same order as calls. Each of them
+        is resolved with the call result or fails on response timeout.
+        """
+        assert self._ws, "listen() should be called before using send_batch"
+        assert calls, "Batch should contain at least one call"
+        requests, futures = zip(
+            *(self._new_request(method, params) for method, params in calls)
+        )
+        frame = "[" + ",".join(self._codec.dumps_model(req) for req in requests) + "]"
+        try:
+            await self._ws.send(frame)
+        except BaseException:
+            for req in requests:
+                self._requests.discard(req.id)
+            raise
+        return [
+            asyncio.ensure_future(self._wait_response(req.id, future))
+            for req, future in zip(requests, futures)
+        ]
+
+    def _new_request(
+        self, method: str, params: Optional[BaseModel]
+    ) -> Tuple[JSONRPCRequest, "asyncio.Future[Any]"]:
+        req_id, future = self._requests.create()
         req = JSONRPCRequest(
             id=req_id,
             method=method,
             params=params,
         )
-        future: "asyncio.Future[Any]" = asyncio.Future()
-        self._res_futures[req_id] = future
-        await self._ws.send(req.model_dump_json(by_alias=True))
-        result = await asyncio.wait_for(
-            future, timeout=self._response_timeout.total_seconds()
-        )
-        return result
+        return req, future
+
+    async def _wait_response(
+        self,
+        req_id: Optional[IdType],
+        future: "asyncio.Future[Any]",
+        timeout: Optional[float] = None,
+    ) -> Any:
+        if timeout is None:
+            timeout = self._response_timeout.total_seconds()
+        try:
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            # No-op if response was received, otherwise drops entry of
+            # timed out or cancelled request
+            self._requests.discard(req_id)
 
     @asynccontextmanager
     async def listen(self, ws: WebSocketClientProtocol) -> AsyncIterator[None]:
         self._ws = ws
-        async with cancel_on_exit(self._listen_incoming()):
+        async with AsyncExitStack() as stack:
+            for _ in range(self._dispatch.max_in_flight):
+                await stack.enter_async_context(cancel_on_exit(self._dispatch_worker()))
+            await stack.enter_async_context(cancel_on_exit(self._listen_incoming()))
             yield
 
     async def _listen_incoming(self) -> None:
@@ -148,30 +377,34 @@ class JSONRPCClient:
             except Exception as e:
                 # Fail all futures for pending requests, as they
                 # will never receive response
-                for key, future in list(self._res_futures.items()):
-                    if not future.done():
-                        self._res_futures.pop(key)
-                        future.set_exception(e)
+                self._requests.fail_all(e)
                 raise e
             if raw is None:
                 continue
-            asyncio.create_task(self._handle_raw_message(raw))
+            await self._handle_raw_message(raw)
 
     async def _handle_raw_message(self, raw: Union[str, bytes]) -> None:
         try:
-            try:
-                message = TypeAdapter(AnyJsonRPCMessage).validate_json(raw)
-            except ValueError:
-                logger.warning(f"Got invalid json-rpc message from server: {raw!r}")
-                return
-            if isinstance(message, JSONRPCNotification):
-                await self._handle_notification(message)
-            if isinstance(message, JSONRPCRequest):
-                await self._handle_request(message)
-            if isinstance(message, JSONRPCResponse):
-                await self._handle_response(message)
-            if isinstance(message, JSONRPCErrorResponse):
-                await self._handle_error(message)
+            messages = self._decoder.decode(raw)
+        except ValueError:
+            logger.warning(f"Got invalid json-rpc message from server: {raw!r}")
+            return
+        for message in messages:
+            if isinstance(message, (JSONRPCResponse, JSONRPCErrorResponse)):
+                # Resolving a future never blocks, so responses are handled
+                # right away instead of waiting behind queued notifications
+                await self._handle_message(message)
+            else:
+                await self._dispatch_queue.put(message)
+
+    async def _dispatch_worker(self) -> None:
+        while True:
+            message = await self._dispatch_queue.get()
+            await self._handle_message(message)
+
+    async def _handle_message(self, message: AnyJsonRPCMessage) -> None:
+        try:
+            await self._message_handlers[type(message)](message)
         except Exception:
             logger.exception("Error during processing JSON RPC message")
 
@@ -181,21 +414,66 @@ class JSONRPCClient:
             await listener.handler(param)
 
     async def _handle_request(self, message: JSONRPCRequest) -> None:
-        logger.warning("Incoming JSONRPC request are not supported")
+        assert self._ws, "listen() should be called before handling requests"
+        response: Union[JSONRPCResponse, JSONRPCErrorResponse]
+        try:
+            result = await self._call_request_handler(message)
+        except JSONRPCCallError as e:
+            response = JSONRPCErrorResponse(
+                id=message.id,
+                error=JSONRPCError(code=e.code, message=e.message, data=e.data),
+            )
+        except Exception as e:
+            logger.exception(f"Failed to handle JSON-RPC request {message.method}")
+            response = JSONRPCErrorResponse(
+                id=message.id,
+                error=JSONRPCError(code=ErrorCodes.SERVER_ERROR.value, message=str(e)),
+            )
+        else:
+            if isinstance(result, BaseModel):
+                result = result.model_dump(mode="json", by_alias=True)
+            response = JSONRPCResponse(id=message.id, result=result)
+        await self._ws.send(self._codec.dumps_model(response))
+
+    async def _call_request_handler(self, message: JSONRPCRequest) -> Any:
+        handler = self._request_handlers.get(message.method)
+        if handler is None:
+            raise JSONRPCCallError(
+                code=ErrorCodes.METHOD_NOT_FOUND.value,
+                message=f"Method {message.method} not found",
+            )
+        try:
+            param = handler.prepare_param(message.params)
+        except (ValueError, TypeError) as e:
+            raise JSONRPCCallError(
+                code=ErrorCodes.INVALID_PARAMS.value, message=str(e)
+            ) from e
+        return await handler.handler(param)
 
     async def _handle_response(self, message: JSONRPCResponse) -> None:
-        if message.id is None:
-            return
-        future = self._res_futures.pop(message.id)
+        future = self._pop_future(message.id)
         if future:
             future.set_result(message.result)
-        else:
-            logger.warning(f"Got JSON-RPC response for unknown id {message.id}")
 
     async def _handle_error(self, message: JSONRPCErrorResponse) -> None:
         logger.warning(
             f"Got error JSON-RPC response: id={message.id} "
-            f"error.message={message.error.message}"
-            f"error.code={message.error.code}"
+            f"error.message={message.error.message} "
+            f"error.code={message.error.code} "
             f"error.data={message.error.data}"
         )
+        future = self._pop_future(message.id)
+        if future:
+            future.set_exception(JSONRPCCallError.from_error(message.error))
+
+    def _pop_future(self, req_id: Optional[IdType]) -> "Optional[asyncio.Future[Any]]":
+        if req_id is None:
+            return None
+        future = self._requests.pop(req_id)
+        if future is None:
+            logger.warning(f"Got JSON-RPC response for unknown id {req_id}")
+            return None
+        if future.done():
+            # Caller has already given up on this request
+            return None
+        return future
@@ -0,0 +1,371 @@
+import asyncio
+import datetime
+import logging
+import math
+from collections import OrderedDict
+from contextlib import AsyncExitStack
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from searcher_sdk.client import AuctionClient, PingNotReceived
+from searcher_sdk.clock import ClockOffsetEstimator
+from searcher_sdk.models import BidData, MakeBidResult, SearcherInfoWithTraceContext
+from searcher_sdk.telemetry import RttHistogram
+from searcher_sdk.utils import Backoff, cancel_on_exit
+
+logger = logging.getLogger(__name__)
+
+
+class RedundantAuctionClient(AuctionClient):
+    """Listens for lots over several broadcaster connections at once
+
+    Every lot is yielded once, by whichever connection delivered it first,
+    later copies are dropped by lot_id. Broken connections are reopened
+    in background while the rest keep delivering lots, PingNotReceived is
+    raised only when there is no live connection left. Bids are sent
+    over the healthiest live connection.
+
+    With several connections to the same url this works as a hot standby:
+    when active connection breaks, lots keep flowing through the warm one.
+
+    Accepts same keyword arguments as AuctionClient, they are applied
+    to every connection.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        token: str,
+        connections_per_url: int = 1,
+        backoff: Optional[Backoff] = None,
+        stable_period: datetime.timedelta = datetime.timedelta(minutes=1),
+        dedup_window: int = 10_000,
+        **client_kwargs: Any,
+    ) -> None:
+        assert urls, "At least one url is required"
+        # Connections share clock offset estimate
+        client_kwargs.setdefault("clock", ClockOffsetEstimator())
+        super().__init__(urls[0], token, **client_kwargs)
+        self._clients: List[AuctionClient] = [
+            AuctionClient(url, token, **client_kwargs)
+            for url in urls
+            for _ in range(connections_per_url)
+        ]
+        self._backoff = backoff or Backoff()
+        self._stable_period = stable_period
+        self._seen_lots = _SeenLots(dedup_window)
+        self.duplicate_lots = 0
+
+    @property
+    def clients(self) -> List[AuctionClient]:
+        return list(self._clients)
+
+    @property
+    def connected(self) -> bool:
+        return any(client.connected for client in self._clients)
+
+    @property
+    def pending_requests(self) -> int:
+        return sum(client.pending_requests for client in self._clients)
+
+    def on_request(self, method: str) -> Callable[[Any], Any]:
+        def register(handler: Any) -> Any:
+            for client in self._clients:
+                client.on_request(method)(handler)
+            return handler
+
+        return register
+
+    async def make_bid(
+        self, lot_id: str, bid: BidData, deadline: Optional[float] = None
+    ) -> MakeBidResult:
+        return await self._pick_client().make_bid(lot_id, bid, deadline)
+
+    async def __aenter__(self) -> "RedundantAuctionClient":
+        if self._connected:
+            return self
+        self._exit_stack = AsyncExitStack()
+        self._queue = self._make_lot_queue()
+        self._seen_lots.clear()
+
+        results = await asyncio.gather(
+            *(client.__aenter__() for client in self._clients),
+            return_exceptions=True,
+        )
+        errors = [res for res in results if isinstance(res, BaseException)]
+        if len(errors) == len(self._clients):
+            raise errors[0]
+
+        await self._exit_stack.__aenter__()
+        for client in self._clients:
+            await self._exit_stack.enter_async_context(
+                cancel_on_exit(self._run_connection(client))
+            )
+        self._connected = True
+        return self
+
+    def _pick_client(self) -> AuctionClient:
+        live = [client for client in self._clients if client.connected]
+        if not live:
+            raise ConnectionError("No live broadcaster connection")
+        return min(
+            live,
+            key=lambda client: (
+                client.pending_requests,
+                client.rtt.p50 if client.rtt.p50 is not None else math.inf,
+            ),
+        )
+
+    async def _run_connection(self, client: AuctionClient) -> None:
+        loop = asyncio.get_event_loop()
+        failures = 0
+        while True:
+            started = loop.time()
+            try:
+                await client.__aenter__()
+                async for info in client.listen_as_iter():
+                    await self._forward_lot(info)
+            except Exception as e:
+                logger.warning(f"Connection to {client.url} is broken: {e!r}")
+            finally:
+                await client.__aexit__(None, None, None)
+            if not self.connected:
+                await self._queue.put(
+                    PingNotReceived("Broken connection: all connections are lost")
+                )
+            if loop.time() - started >= self._stable_period.total_seconds():
+                failures = 0
+            delay = self._backoff.delay(failures)
+            failures += 1
+            logger.info(f"Reconnecting to {client.url} in {delay:.2f} seconds")
+            await asyncio.sleep(delay)
+
+    async def _forward_lot(self, info: SearcherInfoWithTraceContext) -> None:
+        if self._seen_lots.add(info.lot_id):
+            await self._queue.put(info)
+        else:
+            self.duplicate_lots += 1
+
+
+class FailoverAuctionClient(AuctionClient):
+    """Listens for lots from the broadcaster endpoint with the lowest RTT
+
+    Endpoints are ranked by websocket ping RTT over short-lived probe
+    connections, ranking is refreshed every probe_interval. When active
+    connection breaks, client moves to the next best endpoint. When another
+    endpoint becomes faster than active one by more than switch_margin
+    (fraction of active RTT), client moves to it: new connection is opened
+    before the old one is closed and lots received twice meanwhile are
+    dropped. PingNotReceived is raised when no endpoint accepts connection.
+
+    Accepts same keyword arguments as AuctionClient, they are applied
+    to every connection.
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        token: str,
+        probe_interval: datetime.timedelta = datetime.timedelta(minutes=1),
+        probe_pings: int = 3,
+        switch_margin: float = 0.2,
+        backoff: Optional[Backoff] = None,
+        dedup_window: int = 10_000,
+        **client_kwargs: Any,
+    ) -> None:
+        assert urls, "At least one url is required"
+        assert len(set(urls)) == len(urls), "Urls should be unique"
+        # Connections share clock offset estimate
+        client_kwargs.setdefault("clock", ClockOffsetEstimator())
+        super().__init__(urls[0], token, **client_kwargs)
+        self._clients = [AuctionClient(url, token, **client_kwargs) for url in urls]
+        self._probe_interval = probe_interval
+        self._probe_pings = probe_pings
+        self._switch_margin = switch_margin
+        self._backoff = backoff or Backoff()
+        self._endpoint_rtt: Dict[str, float] = {url: math.inf for url in urls}
+        self._active: Optional[AuctionClient] = None
+        self._switch = asyncio.Event()
+        self._seen_lots = _SeenLots(dedup_window)
+        self.failovers = 0  # Moves caused by broken connection
+
+    @property
+    def clients(self) -> List[AuctionClient]:
+        return list(self._clients)
+
+    @property
+    def active_url(self) -> Optional[str]:
+        return self._active.url if self._active else None
+
+    @property
+    def endpoint_rtt(self) -> Dict[str, float]:
+        """Last probed RTT by url, in seconds, inf for unreachable endpoints"""
+        return dict(self._endpoint_rtt)
+
+    @property
+    def connected(self) -> bool:
+        return self._active is not None and self._active.connected
+
+    @property
+    def pending_requests(self) -> int:
+        return sum(client.pending_requests for client in self._clients)
+
+    @property
+    def rtt(self) -> RttHistogram:
+        return self._active.rtt if self._active else self._rtt
+
+    def on_request(self, method: str) -> Callable[[Any], Any]:
+        def register(handler: Any) -> Any:
+            for client in self._clients:
+                client.on_request(method)(handler)
+            return handler
+
+        return register
+
+    async def make_bid(
+        self, lot_id: str, bid: BidData, deadline: Optional[float] = None
+    ) -> MakeBidResult:
+        if not self.connected:
+            raise ConnectionError("No live broadcaster connection")
+        assert self._active
+        return await self._active.make_bid(lot_id, bid, deadline)
+
+    async def __aenter__(self) -> "FailoverAuctionClient":
+        if self._connected:
+            return self
+        self._exit_stack = AsyncExitStack()
+        self._queue = self._make_lot_queue()
+        self._switch = asyncio.Event()
+        self._seen_lots.clear()
+
+        await self._probe_all()
+        client = await self._connect_best()
+        if client is None:
+            raise ConnectionError("Failed to connect to any broadcaster endpoint")
+        self._active = client
+
+        await self._exit_stack.__aenter__()
+        await self._exit_stack.enter_async_context(
+            cancel_on_exit(self._run_active(client))
+        )
+        await self._exit_stack.enter_async_context(cancel_on_exit(self._probe_loop()))
+        self._connected = True
+        return self
+
+    def _ranked(self) -> List[AuctionClient]:
+        return sorted(self._clients, key=lambda client: self._endpoint_rtt[client.url])
+
+    async def _probe(self, client: AuctionClient) -> float:
+        try:
+            return await client._probe_rtt(self._probe_pings)
+        except Exception as e:
+            logger.warning(f"Failed to probe {client.url}: {e!r}")
+            return math.inf
+
+    async def _probe_all(self) -> None:
+        rtts = await asyncio.gather(*(self._probe(client) for client in self._clients))
+        for client, rtt in zip(self._clients, rtts):
+            self._endpoint_rtt[client.url] = rtt
+
+    async def _connect_best(self) -> Optional[AuctionClient]:
+        for client in self._ranked():
+            try:
+                await client.__aenter__()  # No-op for active connection
+            except Exception as e:
+                logger.warning(f"Failed to connect to {client.url}: {e!r}")
+                self._endpoint_rtt[client.url] = math.inf
+                continue
+            return client
+        return None
+
+    async def _reconnect(self) -> AuctionClient:
+        failures = 0
+        while True:
+            client = await self._connect_best()
+            if client is not None:
+                return client
+            await self._queue.put(
+                PingNotReceived("Broken connection: no broadcaster endpoint is live")
+            )
+            await asyncio.sleep(self._backoff.delay(failures))
+            failures += 1
+            await self._probe_all()
+
+    async def _probe_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._probe_interval.total_seconds())
+            await self._probe_all()
+            active, best = self._active, self._ranked()[0]
+            if active is None or best is active:
+                continue
+            threshold = self._endpoint_rtt[active.url] * (1 - self._switch_margin)
+            if self._endpoint_rtt[best.url] < threshold:
+                logger.info(f"Endpoint {best.url} is faster than {active.url}")
+                self._switch.set()
+
+    async def _run_active(self, client: AuctionClient) -> None:
+        active = client
+        forward = asyncio.ensure_future(self._forward_lots(active))
+        try:
+            while True:
+                self._active = active
+                switch = asyncio.ensure_future(self._switch.wait())
+                try:
+                    done, _ = await asyncio.wait(
+                        {forward, switch}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                finally:
+                    switch.cancel()
+                self._switch.clear()
+                if forward in done:
+                    self._active = None
+                    self._endpoint_rtt[active.url] = math.inf
+                    await active.__aexit__(None, None, None)
+                    self.failovers += 1
+                    active = await self._reconnect()
+                    logger.info(f"Failed over to {active.url}")
+                    forward = asyncio.ensure_future(self._forward_lots(active))
+                    continue
+                best = await self._connect_best()
+                if best is None or best is active:
+                    continue
+                previous, previous_forward = active, forward
+                active = best
+                forward = asyncio.ensure_future(self._forward_lots(active))
+                self._active = active
+                previous_forward.cancel()
+                await asyncio.gather(previous_forward, return_exceptions=True)
+                await previous.__aexit__(None, None, None)
+                logger.info(f"Switched from {previous.url} to {active.url}")
+        finally:
+            self._active = None
+            forward.cancel()
+            await asyncio.gather(forward, return_exceptions=True)
+            await active.__aexit__(None, None, None)
+
+    async def _forward_lots(self, client: AuctionClient) -> None:
+        try:
+            async for info in client.listen_as_iter():
+                if self._seen_lots.add(info.lot_id):
+                    await self._queue.put(info)
+        except Exception as e:
+            logger.warning(f"Connection to {client.url} is broken: {e!r}")
+
+
+class _SeenLots:
+    """Ids of the last `window` lots, to drop lots received twice"""
+
+    def __init__(self, window: int) -> None:
+        self._window = window
+        self._ids: "OrderedDict[str, None]" = OrderedDict()
+
+    def add(self, lot_id: str) -> bool:
+        """Returns False if lot was already seen"""
+        if lot_id in self._ids:
+            return False
+        self._ids[lot_id] = None
+        if len(self._ids) > self._window:
+            self._ids.popitem(last=False)
+        return True
+
+    def clear(self) -> None:
+        self._ids.clear()
@@ -1,24 +1,11 @@
 from typing import Union
 
-from pydantic import AfterValidator, PlainSerializer, PlainValidator
+from pydantic import Field, PlainSerializer, PlainValidator
 from typing_extensions import Annotated
 
-
-def check_starts_with_0x(v: str) -> str:
-    assert v.startswith("0x"), "Hex bytes string should start with 0x"
-    return v
-
-
-def check_valid_bytes(v: str) -> str:
-    bytes.fromhex(v[len("0x") :].lower())
-    return v
-
-
-HexStr = Annotated[
-    str,
-    AfterValidator(check_starts_with_0x),
-    AfterValidator(check_valid_bytes),
-]
+# 0x-prefixed hex encoded bytes. Checked by pydantic-core regex instead of
+# python validators, as it is applied to every address and hash of each lot
+HexStr = Annotated[str, Field(pattern=r"^0x([0-9a-fA-F]{2})*$")]
 
 
 def _parse_hex_int(value: Union[int, str]) -> int:
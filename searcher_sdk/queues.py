@@ -0,0 +1,212 @@
+import asyncio
+import enum
+import heapq
+import itertools
+import math
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+if TYPE_CHECKING:
+    _AnyQueue = asyncio.Queue[Any]
+else:
+    _AnyQueue = asyncio.Queue
+
+
+class OverflowPolicy(enum.Enum):
+    """What to do with new item when bounded queue is full"""
+
+    BLOCK = "block"  # Wait until there is free space
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued item
+    DROP_NEWEST = "drop_newest"  # Discard the item being put
+
+
+class BoundedQueue(Generic[T]):
+    """asyncio.Queue with configurable overflow policy
+
+    Number of items discarded due to overflow is counted in `dropped`.
+    maxsize <= 0 means unbounded queue, so overflow policy is never applied.
+    """
+
+    def __init__(
+        self, maxsize: int = 0, overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    ) -> None:
+        self._queue: "asyncio.Queue[T]" = self._make_queue(maxsize)
+        self._overflow = overflow
+        self.dropped = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._queue.maxsize
+
+    def qsize(self) -> int:
+        return self._queue.qsize()
+
+    def empty(self) -> bool:
+        return self._queue.empty()
+
+    async def put(self, item: T) -> None:
+        if self._queue.full():
+            if self._overflow is OverflowPolicy.DROP_NEWEST:
+                self._drop(item)
+                return
+            if self._overflow is OverflowPolicy.DROP_OLDEST:
+                self._drop(self._evict_oldest())
+        await self._queue.put(item)
+
+    async def get(self) -> T:
+        return await self._queue.get()
+
+    def get_nowait(self) -> T:
+        return self._queue.get_nowait()
+
+    def _make_queue(self, maxsize: int) -> "asyncio.Queue[T]":
+        return asyncio.Queue(maxsize)
+
+    def _evict_oldest(self) -> T:
+        return self._queue.get_nowait()
+
+    def _drop(self, item: T) -> None:
+        self.dropped += 1
+
+
+class _HeapQueue(_AnyQueue):
+    """asyncio.Queue that returns items in order of key(item)
+
+    Items with equal keys are returned in arrival order.
+    """
+
+    _queue: List[Tuple[float, int, Any]]
+
+    def __init__(self, maxsize: int, key: Callable[[Any], float]) -> None:
+        self._key = key
+        self._counter = itertools.count()
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue = []
+
+    def _put(self, item: Any) -> None:
+        heapq.heappush(self._queue, (self._key(item), next(self._counter), item))
+
+    def _get(self) -> Any:
+        return heapq.heappop(self._queue)[2]
+
+    def pop_oldest(self) -> Any:
+        """Remove item that was put first, regardless of its key"""
+        if not self._queue:
+            raise asyncio.QueueEmpty
+        index = min(range(len(self._queue)), key=lambda i: self._queue[i][1])
+        entry = self._queue.pop(index)
+        heapq.heapify(self._queue)
+        return entry[2]
+
+
+class Scheduling(enum.Enum):
+    """Order in which queued lots are processed"""
+
+    FIFO = "fifo"  # Arrival order
+    EDF = "edf"  # Earliest min_deadline first, lots without it go last
+
+
+@dataclass
+class LotQueueConfig:
+    """Limits of the queue of received lots waiting to be processed
+
+    With drop_expired lots whose min_deadline has passed are dropped instead
+    of being returned to the strategy. They are also purged first when the
+    queue is full. With EDF scheduling DROP_OLDEST still evicts the lot that
+    arrived first, not the most urgent one.
+    """
+
+    maxsize: int = 0
+    overflow: OverflowPolicy = OverflowPolicy.BLOCK
+    drop_expired: bool = False
+    scheduling: Scheduling = Scheduling.FIFO
+
+
+@dataclass
+class LotQueueStats:
+    expired: int = 0  # Dropped because min_deadline has passed
+    evicted: int = 0  # Dropped due to queue overflow
+
+
+class LotQueue(BoundedQueue[T]):
+    """Deadline-aware queue of lots
+
+    Items are expected to have min_deadline attribute (unix timestamp or None).
+    Exceptions can be put to the queue to signal broken connection, they are
+    never dropped and with EDF scheduling they go before any lot.
+    """
+
+    def __init__(
+        self,
+        config: Optional[LotQueueConfig] = None,
+        stats: Optional[LotQueueStats] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self._config = config or LotQueueConfig()
+        super().__init__(self._config.maxsize, self._config.overflow)
+        self.stats = stats or LotQueueStats()
+        self._clock = clock
+
+    async def put(self, item: T) -> None:
+        if self._queue.full() and self._config.drop_expired:
+            self._purge_expired()
+        if isinstance(item, BaseException) and self._queue.full():
+            self._drop(self._evict_oldest())
+        await super().put(item)
+
+    async def get(self) -> T:
+        while True:
+            item = await super().get()
+            if not self._is_expired(item):
+                return item
+            self.stats.expired += 1
+
+    def get_nowait(self) -> T:
+        while True:
+            item = super().get_nowait()
+            if not self._is_expired(item):
+                return item
+            self.stats.expired += 1
+
+    def _make_queue(self, maxsize: int) -> "asyncio.Queue[T]":
+        if self._config.scheduling is Scheduling.EDF:
+            return _HeapQueue(maxsize, key=_deadline_key)
+        return super()._make_queue(maxsize)
+
+    def _evict_oldest(self) -> T:
+        if isinstance(self._queue, _HeapQueue):
+            item: T = self._queue.pop_oldest()
+            return item
+        return super()._evict_oldest()
+
+    def _drop(self, item: T) -> None:
+        super()._drop(item)
+        self.stats.evicted += 1
+
+    def _is_expired(self, item: Any) -> bool:
+        if not self._config.drop_expired or isinstance(item, BaseException):
+            return False
+        deadline: Optional[int] = getattr(item, "min_deadline", None)
+        return deadline is not None and deadline <= self._clock()
+
+    def _purge_expired(self) -> None:
+        items: List[T] = []
+        while not self._queue.empty():
+            items.append(self._queue.get_nowait())
+        for item in items:
+            if self._is_expired(item):
+                self.stats.expired += 1
+            else:
+                self._queue.put_nowait(item)
+
+
+def _deadline_key(item: Any) -> float:
+    if isinstance(item, BaseException):
+        return -math.inf
+    deadline: Optional[int] = getattr(item, "min_deadline", None)
+    return math.inf if deadline is None else deadline
@@ -0,0 +1,78 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+class LotSupervisor:
+    """Runs lot processing tasks with bounded concurrency
+
+    submit() waits while `concurrency` tasks are already running, so caller
+    stops taking new lots from the queue instead of piling up tasks. Each
+    task is cancelled when its lot deadline (unix timestamp) passes, or after
+    default_timeout seconds for lots without deadline.
+
+    Should be created inside running event loop.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 1,
+        default_timeout: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        assert concurrency > 0, "Concurrency should be positive"
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._default_timeout = default_timeout
+        self._clock = clock
+        self._tasks: Set["asyncio.Task[None]"] = set()
+        self.timed_out = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._tasks)
+
+    async def submit(
+        self, deadline: Optional[float], func: Callable[[], Awaitable[None]]
+    ) -> "asyncio.Task[None]":
+        await self._semaphore.acquire()
+        try:
+            task = asyncio.create_task(self._run(deadline, func))
+        except BaseException:
+            self._semaphore.release()
+            raise
+        self._tasks.add(task)
+        task.add_done_callback(self._on_done)
+        return task
+
+    def cancel_all(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+
+    async def drain(self, timeout: float) -> None:
+        """Wait for running tasks to finish, cancel them after timeout"""
+        if self._tasks:
+            await asyncio.wait(set(self._tasks), timeout=timeout)
+        if self._tasks:
+            logger.warning(f"Cancelling {len(self._tasks)} unfinished lot tasks")
+            tasks = set(self._tasks)
+            self.cancel_all()
+            await asyncio.wait(tasks)
+
+    async def _run(
+        self, deadline: Optional[float], func: Callable[[], Awaitable[None]]
+    ) -> None:
+        try:
+            timeout = self._default_timeout
+            if deadline is not None:
+                timeout = max(0.0, deadline - self._clock())
+            await asyncio.wait_for(func(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            logger.warning("Lot processing cancelled: deadline has passed")
+
+    def _on_done(self, task: "asyncio.Task[None]") -> None:
+        self._tasks.discard(task)
+        self._semaphore.release()
@@ -0,0 +1,107 @@
+import enum
+import math
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Optional
+
+
+class PingMode(enum.Enum):
+    """How AuctionClient checks that connection is alive"""
+
+    JSONRPC = "jsonrpc"  # Auction "ping" method, round trip through server code
+    WEBSOCKET = "websocket"  # Ping control frame, answered by websocket layer
+
+
+class RttHistogram:
+    """Rolling window of round trip times, in seconds"""
+
+    def __init__(self, window: int = 256) -> None:
+        assert window > 0, "Window should be positive"
+        self._samples: Deque[float] = deque(maxlen=window)
+        self.count = 0  # Total number of recorded samples
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, rtt: float) -> None:
+        self._samples.append(rtt)
+        self.count += 1
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._samples[-1] if self._samples else None
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.percentile(50)
+
+    @property
+    def p99(self) -> Optional[float]:
+        return self.percentile(99)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Nearest-rank percentile of samples in window, None if empty"""
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(1, math.ceil(q / 100 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+
+class AdaptivePingInterval:
+    """Pings often while RTT looks degraded, backs off while it is stable
+
+    RTT counts as degraded when the last sample exceeds `degraded_ratio`
+    times the window median. Then interval drops to minimum and doubles
+    after every healthy sample until it reaches maximum again.
+    """
+
+    def __init__(
+        self, minimum: float, maximum: float, degraded_ratio: float = 2.0
+    ) -> None:
+        self._minimum = min(minimum, maximum)
+        self._maximum = maximum
+        self._degraded_ratio = degraded_ratio
+        self._current = maximum
+
+    @property
+    def current(self) -> float:
+        return self._current
+
+    def next(self, rtt: RttHistogram) -> float:
+        if self._is_degraded(rtt):
+            self._current = self._minimum
+        else:
+            self._current = min(self._current * 2, self._maximum)
+        return self._current
+
+    def _is_degraded(self, rtt: RttHistogram) -> bool:
+        last, median = rtt.last, rtt.p50
+        if last is None or median is None or len(rtt) < 2:
+            return False
+        return last > median * self._degraded_ratio
+
+
+@dataclass
+class TimeoutPolicy:
+    """Response timeout derived from observed RTT: p99 * multiplier
+
+    Result is clamped to [floor, ceiling] seconds. Until min_samples RTT
+    values are recorded timeout() returns None and fixed timeouts apply.
+    RTT is measured with pings, so floor should leave room for server
+    processing time of heavier requests like make_bid.
+    """
+
+    multiplier: float = 4.0
+    floor: float = 0.25
+    ceiling: float = 5.0
+    min_samples: int = 10
+
+    def timeout(self, rtt: RttHistogram) -> Optional[float]:
+        p99 = rtt.p99
+        if p99 is None or len(rtt) < self.min_samples:
+            return None
+        return min(max(p99 * self.multiplier, self.floor), self.ceiling)
@@ -0,0 +1,56 @@
+import socket
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from websockets.legacy.client import WebSocketClientProtocol
+
+SocketOption = Tuple[int, int, int]  # level, option name, value
+
+
+@dataclass
+class TransportConfig:
+    """Websocket connection options
+
+    Defaults match websockets library defaults, except for compression:
+    auction messages are small, so permessage-deflate costs more CPU time
+    on both ends than it saves on the wire. Set compression="deflate"
+    to negotiate it anyway.
+    """
+
+    compression: Optional[str] = None
+    max_size: Optional[int] = 2**20
+    max_queue: Optional[int] = 2**5
+    read_limit: int = 2**16
+    write_limit: int = 2**16
+    open_timeout: Optional[float] = 10
+    close_timeout: Optional[float] = None
+    # websockets-level keepalive pings, independent of auction JSON-RPC pings
+    ws_ping_interval: Optional[float] = 20
+    ws_ping_timeout: Optional[float] = 20
+    tcp_nodelay: bool = True
+    socket_options: List[SocketOption] = field(default_factory=list)
+
+    def connect_kwargs(self) -> Dict[str, Any]:
+        return {
+            "compression": self.compression,
+            "max_size": self.max_size,
+            "max_queue": self.max_queue,
+            "read_limit": self.read_limit,
+            "write_limit": self.write_limit,
+            "open_timeout": self.open_timeout,
+            "close_timeout": self.close_timeout,
+            "ping_interval": self.ws_ping_interval,
+            "ping_timeout": self.ws_ping_timeout,
+        }
+
+    def configure_socket(self, ws: WebSocketClientProtocol) -> None:
+        sock: Optional[socket.socket] = ws.transport.get_extra_info("socket")
+        if sock is None:
+            return
+        options = list(self.socket_options)
+        if sock.family in (socket.AF_INET, socket.AF_INET6):
+            options.insert(
+                0, (socket.IPPROTO_TCP, socket.TCP_NODELAY, int(self.tcp_nodelay))
+            )
+        for level, name, value in options:
+            sock.setsockopt(level, name, value)
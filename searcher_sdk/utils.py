@@ -1,5 +1,7 @@
 import asyncio
+import random
 from contextlib import asynccontextmanager, suppress
+from dataclasses import dataclass
 from typing import Any, AsyncIterator, Coroutine
 
 import eth_account
@@ -97,6 +99,26 @@ def _get_domain_hash(domain_info: SignatureDomainInfo) -> bytes:
     )
 
 
+@dataclass
+class Backoff:
+    """Exponential backoff with jitter
+
+    Delay grows as initial * multiplier ** attempt up to maximum, and then
+    a random part of it, up to jitter fraction, is subtracted, so clients
+    don't reconnect in lockstep.
+    """
+
+    initial: float = 0.1
+    maximum: float = 30
+    multiplier: float = 2
+    jitter: float = 0.5
+
+    def delay(self, attempt: int) -> float:
+        # Exponent is capped to avoid float overflow on long failure streaks
+        delay = min(self.maximum, self.initial * self.multiplier ** min(attempt, 64))
+        return delay * (1 - self.jitter * random.random())
+
+
 @asynccontextmanager
 async def cancel_on_exit(
     coro: Coroutine[Any, Any, Any], timeout_sec: float = 5
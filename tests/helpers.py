@@ -3,6 +3,7 @@ import secrets
 import time
 from typing import Any, Callable, Dict, Generic, Type, TypeVar
 
+from polyfactory import Use
 from polyfactory.factories.pydantic_factory import ModelFactory
 from pydantic import BaseModel
 
@@ -40,6 +41,8 @@ class CustomModelFactory(Generic[T], ModelFactory[T]):
 class SearcherInfoFactory(CustomModelFactory[SearcherInfo]):
     __model__ = SearcherInfo
 
+    min_deadline = Use(lambda: int(time.time()) + 1000)
+
 
 class BidDataFactory(CustomModelFactory[BidData]):
     __model__ = BidData
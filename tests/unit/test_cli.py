@@ -0,0 +1,166 @@
+import asyncio
+import datetime
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, List, Optional
+
+from searcher_sdk import (
+    AuctionClient,
+    BaseSearcherConfig,
+    CLISearcher,
+    SearcherInfo,
+    SearcherRequest,
+    SignatureDomainInfo,
+)
+from searcher_sdk.models import SearcherInfoWithTraceContext
+
+from tests.helpers import SearcherInfoFactory
+
+
+@dataclass
+class FlakySearcherConfig(BaseSearcherConfig):
+    pass
+
+
+class FlakySearcher(CLISearcher[FlakySearcherConfig]):
+    """Searcher that loses connection after given number of seconds"""
+
+    config_class = FlakySearcherConfig
+
+    def __init__(self, lifetimes: List[float]) -> None:
+        super().__init__(
+            client=AuctionClient("ws://localhost", "token"),
+            config=FlakySearcherConfig(
+                domain_info=SignatureDomainInfo(contract_addr="0x00", chain_id=1),
+                private_key_hex="0x00",
+            ),
+            max_reconnects=3,
+            reconnect_timeout=0,
+            stable_period=datetime.timedelta(seconds=0.05),
+        )
+        self.lifetimes = lifetimes
+        self.runs = 0
+
+    async def run_forever(self) -> None:
+        self.runs += 1
+        await asyncio.sleep(self.lifetimes.pop(0))
+        raise ConnectionError("Connection lost")
+
+    async def _make_searcher_request(
+        self, info: SearcherInfo
+    ) -> Optional[SearcherRequest]:
+        return None
+
+
+async def test_retries_stop_after_max_reconnects() -> None:
+    # Arrange
+    searcher = FlakySearcher(lifetimes=[0] * 10)
+
+    # Act
+    await searcher._run_with_retries()
+
+    # Assert
+    assert searcher.runs == 3
+
+
+async def test_retries_counter_reset_after_stable_connection() -> None:
+    # Arrange
+    searcher = FlakySearcher(lifetimes=[0, 0, 0.1, 0, 0.1, 0, 0, 0])
+
+    # Act
+    await searcher._run_with_retries()
+
+    # Assert
+    assert searcher.runs == 7
+
+
+class ScriptedClient(AuctionClient):
+    """Client that yields given lots and then loses connection"""
+
+    def __init__(self, infos: List[SearcherInfoWithTraceContext]) -> None:
+        super().__init__("ws://localhost", "token")
+        self.infos = infos
+
+    async def __aenter__(self) -> "ScriptedClient":
+        self._connected = True
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        self._connected = False
+
+    async def listen_as_iter(self) -> AsyncIterator[SearcherInfoWithTraceContext]:
+        for info in self.infos:
+            yield info
+        await asyncio.sleep(0.05)
+        raise ConnectionError("Connection lost")
+
+
+class SlowSearcher(CLISearcher[FlakySearcherConfig]):
+    """Searcher that never finishes making a bid"""
+
+    config_class = FlakySearcherConfig
+
+    def __init__(self, client: AuctionClient, concurrency: int) -> None:
+        super().__init__(
+            client=client,
+            config=FlakySearcherConfig(
+                domain_info=SignatureDomainInfo(contract_addr="0x00", chain_id=1),
+                private_key_hex="0x00",
+            ),
+            max_reconnects=1,
+            reconnect_timeout=0,
+            concurrency=concurrency,
+        )
+        self.started = 0
+        self.cancelled = 0
+
+    async def _make_searcher_request(
+        self, info: SearcherInfo
+    ) -> Optional[SearcherRequest]:
+        self.started += 1
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return None
+
+
+async def test_run_forever_cancels_lots_when_connection_is_lost() -> None:
+    # Arrange
+    infos = [
+        SearcherInfoWithTraceContext(**SearcherInfoFactory.build().model_dump())
+        for _ in range(2)
+    ]
+    searcher = SlowSearcher(ScriptedClient(infos), concurrency=2)
+
+    # Act
+    try:
+        await searcher.run_forever()
+    except ConnectionError:
+        pass
+
+    # Assert
+    assert searcher.started == 2
+    assert searcher.cancelled == 2
+    assert searcher.lots_in_flight == 0
+
+
+async def test_run_forever_limits_concurrency() -> None:
+    # Arrange
+    infos = [
+        SearcherInfoWithTraceContext(**SearcherInfoFactory.build().model_dump())
+        for _ in range(3)
+    ]
+    searcher = SlowSearcher(ScriptedClient(infos), concurrency=2)
+
+    # Act
+    task = asyncio.create_task(searcher.run_forever())
+    await asyncio.sleep(0.02)
+    in_flight = searcher.lots_in_flight
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    # Assert
+    assert in_flight == 2
+    assert searcher.started == 2
+    assert searcher.lots_in_flight == 0
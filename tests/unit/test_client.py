@@ -2,11 +2,12 @@ import asyncio
 import contextlib
 import dataclasses
 import datetime
+import socket
 import threading
 import time
 from multiprocessing import Queue
 from queue import Empty
-from typing import Any, Dict, Iterator, List
+from typing import Any, Dict, Iterator, List, Optional
 
 import pytest
 import uvicorn
@@ -14,9 +15,18 @@ from fastapi import FastAPI, WebSocket
 from starlette.websockets import WebSocketDisconnect
 from websockets.exceptions import ConnectionClosed
 
-from searcher_sdk import AuctionClient, BidData, SearcherInfo, SearcherRequest
+from searcher_sdk import (
+    AuctionClient,
+    BidData,
+    FailoverAuctionClient,
+    RedundantAuctionClient,
+    SearcherInfo,
+    SearcherRequest,
+)
 from searcher_sdk.client import PingNotReceived
-from searcher_sdk.utils import cancel_on_exit
+from searcher_sdk.telemetry import PingMode, TimeoutPolicy
+from searcher_sdk.transport import TransportConfig
+from searcher_sdk.utils import Backoff, cancel_on_exit
 
 from tests.helpers import (
     BidDataFactory,
@@ -102,7 +112,7 @@ def fake_server() -> Iterator[MockAuctionServer]:
 @pytest.fixture()
 def info() -> SearcherInfo:
     return SearcherInfoFactory.build(
-        min_deadline=1000,
+        min_deadline=int(time.time()) + 1000,
         swap_info=SwapInfoFactory.build(),
     )
 
@@ -161,6 +171,33 @@ async def test_lots_received(
     assert any_info in infos_received
 
 
+@pytest.mark.parametrize("compression", [None, "deflate"])
+async def test_transport_config_applied(
+    fake_server: MockAuctionServer, info: SearcherInfo, compression: Optional[str]
+) -> None:
+    # Arrange
+    fake_server.send_queue.put_nowait(
+        {"method": "user_transaction", "params": info_to_params(info)}
+    )
+    client = AuctionClient(
+        fake_server.url, "token", transport=TransportConfig(compression=compression)
+    )
+
+    # Act
+    async with client:
+        received = await asyncio.wait_for(client.listen_as_iter().__anext__(), 1)
+        ws = client._json_rpc_client._ws
+        assert ws is not None
+        extensions = [extension.name for extension in ws.extensions]
+        sock = ws.transport.get_extra_info("socket")
+        nodelay = sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY)
+
+    # Assert
+    assert received.lot_id == info.lot_id
+    assert extensions == ([] if compression is None else ["permessage-deflate"])
+    assert nodelay
+
+
 async def test_bid_sent(fake_server: MockAuctionServer, info: SearcherInfo) -> None:
     # Arrange
     bid: BidData = BidDataFactory.build()
@@ -194,6 +231,44 @@ async def test_bid_sent(fake_server: MockAuctionServer, info: SearcherInfo) -> N
     assert bid.searcher_signature == message_raw["searcherSignature"]
 
 
+async def test_bid_after_deadline_not_sent(
+    fake_server: MockAuctionServer, info: SearcherInfo
+) -> None:
+    # Arrange
+    client = AuctionClient(fake_server.url, "token")
+
+    # Act
+    async with client:
+        with pytest.raises(asyncio.TimeoutError):
+            await client.make_bid(
+                info.lot_id, BidDataFactory.build(), deadline=time.time() - 1
+            )
+
+    # Assert
+    assert not any(mess["method"] == "make_bid" for mess in fake_server.received)
+
+
+async def test_ping_timeout_derived_from_rtt(fake_server: MockAuctionServer) -> None:
+    # Arrange
+    client = AuctionClient(
+        fake_server.url,
+        "token",
+        ping_interval=datetime.timedelta(seconds=0.01),
+        timeout_policy=TimeoutPolicy(floor=0.05, min_samples=2),
+    )
+
+    # Act
+    with pytest.raises(PingNotReceived):
+        async with client:
+            for _ in range(2):
+                await wait_for_condition(lambda: bool(fake_server.received))
+                fake_server.send_queue.put_nowait(
+                    {"id": fake_server.received.pop(0)["id"], "result": "pong"}
+                )
+            # Server stops answering, default ping_timeout is 5 seconds
+            await asyncio.wait_for(client.listen_as_iter().__anext__(), timeout=1)
+
+
 async def test_ping_pong(fake_server: MockAuctionServer) -> None:
     # Arrange
     async def make_bid(_: SearcherInfo) -> None:
@@ -218,6 +293,65 @@ async def test_ping_pong(fake_server: MockAuctionServer) -> None:
             fake_server.received.pop(0)
 
 
+async def test_ping_rtt_recorded(fake_server: MockAuctionServer) -> None:
+    # Arrange
+    client = AuctionClient(
+        fake_server.url,
+        "token",
+        ping_interval=datetime.timedelta(seconds=0.01),
+    )
+
+    # Act
+    async with client:
+        for _ in range(3):
+            await wait_for_condition(lambda: bool(fake_server.received))
+            fake_server.send_queue.put_nowait(
+                {"id": fake_server.received.pop(0)["id"], "result": "pong"}
+            )
+        await wait_for_condition(lambda: client.rtt.count == 3)
+
+    # Assert
+    assert client.rtt.count == 3
+    assert client.rtt.last is not None and client.rtt.last > 0
+
+
+async def test_server_time_from_ping(fake_server: MockAuctionServer) -> None:
+    # Arrange
+    client = AuctionClient(fake_server.url, "token")
+
+    # Act
+    async with client:
+        await wait_for_condition(lambda: bool(fake_server.received))
+        fake_server.send_queue.put_nowait(
+            {
+                "id": fake_server.received.pop(0)["id"],
+                "result": {"timestamp": time.time() + 100},
+            }
+        )
+        await wait_for_condition(lambda: client.rtt.count == 1)
+
+    # Assert
+    assert client.server_time() - time.time() == pytest.approx(100, abs=1)
+
+
+async def test_websocket_ping_mode(fake_server: MockAuctionServer) -> None:
+    # Arrange
+    client = AuctionClient(
+        fake_server.url,
+        "token",
+        ping_interval=datetime.timedelta(seconds=0.01),
+        ping_mode=PingMode.WEBSOCKET,
+    )
+
+    # Act
+    async with client:
+        await wait_for_condition(lambda: client.rtt.count >= 3, timeout=1)
+
+    # Assert
+    assert client.rtt.count >= 3
+    assert fake_server.received == []
+
+
 async def test_ping_pong_auto_disconnect(fake_server: MockAuctionServer) -> None:
     # Arrange
     async def make_bid(_: SearcherInfo) -> None:
@@ -258,3 +392,198 @@ async def test_ping_pong_connection_lost(fake_server: MockAuctionServer) -> None
                 }
             )
             assert await wait_for_condition(lambda: task.done(), timeout=2)
+
+
+async def test_server_request_answered(
+    fake_server: MockAuctionServer, info: SearcherInfo
+) -> None:
+    # Arrange
+    bid: BidData = BidDataFactory.build()
+    client = AuctionClient(fake_server.url, "token")
+
+    @client.on_request("quote")
+    async def quote(_: SearcherInfo) -> BidData:
+        return bid
+
+    async def make_bid(_: SearcherInfo) -> None:
+        pass
+
+    def get_response() -> Optional[Dict[str, Any]]:
+        return next((mess for mess in fake_server.received if mess["id"] == 7), None)
+
+    # Act
+    async with cancel_on_exit(client.listen_lots(make_bid)):
+        fake_server.send_queue.put_nowait(
+            {"id": 7, "method": "quote", "params": info_to_params(info)}
+        )
+        await wait_for_condition(lambda: get_response() is not None, timeout=1)
+
+    # Assert
+    response = get_response()
+    assert response is not None
+    assert BidData(**response["result"]) == bid
+
+
+async def test_redundant_client_deduplicates_lots(
+    fake_server: MockAuctionServer, info: SearcherInfo
+) -> None:
+    # Arrange
+    other_info = SearcherInfoFactory.build()
+    for lot in [info, info, other_info, info, other_info]:
+        fake_server.send_queue.put_nowait(
+            {"method": "user_transaction", "params": info_to_params(lot)}
+        )
+    client = RedundantAuctionClient([fake_server.url], "token", connections_per_url=2)
+    infos_received: List[SearcherInfo] = []
+
+    async def make_bid(info_received: SearcherInfo) -> None:
+        infos_received.append(info_received)
+
+    # Act
+    async with cancel_on_exit(client.listen_lots(make_bid)):
+        await wait_for_condition(lambda: client.duplicate_lots == 3, timeout=1)
+
+    # Assert
+    assert client.duplicate_lots == 3
+    assert sorted(lot.lot_id for lot in infos_received) == sorted(
+        [info.lot_id, other_info.lot_id]
+    )
+
+
+async def test_redundant_client_bid_sent(
+    fake_server: MockAuctionServer, info: SearcherInfo
+) -> None:
+    # Arrange
+    bid: BidData = BidDataFactory.build()
+    fake_server.send_queue.put_nowait(
+        {"method": "user_transaction", "params": info_to_params(info)}
+    )
+    client = RedundantAuctionClient(
+        [fake_server.url, fake_server.url], "token", connections_per_url=1
+    )
+
+    async def make_bid(_: SearcherInfo) -> BidData:
+        return bid
+
+    # Act
+    async with cancel_on_exit(client.listen_lots(make_bid)):
+        await wait_for_condition(
+            lambda: any(mess["method"] == "make_bid" for mess in fake_server.received),
+            timeout=1,
+        )
+
+    # Assert
+    message_raw = next(
+        mess["params"] for mess in fake_server.received if mess["method"] == "make_bid"
+    )
+    assert message_raw["lotId"] == info.lot_id
+
+
+async def test_redundant_client_fails_without_connections() -> None:
+    # Arrange
+    client = RedundantAuctionClient(["ws://127.0.0.1:1", "ws://127.0.0.1:1"], "token")
+
+    # Act & Assert
+    with pytest.raises(OSError):
+        async with client:
+            pass
+
+
+async def test_redundant_client_survives_broken_connection(
+    fake_server: MockAuctionServer, info: SearcherInfo
+) -> None:
+    # Arrange
+    fake_server.send_queue.put_nowait(
+        {"method": "user_transaction", "params": info_to_params(info)}
+    )
+    client = RedundantAuctionClient(
+        [fake_server.url, "ws://127.0.0.1:1"],
+        "token",
+        backoff=Backoff(initial=0.01),
+    )
+
+    # Act
+    async with client:
+        received = await asyncio.wait_for(client.listen_as_iter().__anext__(), 1)
+        live = [sub_client.connected for sub_client in client.clients]
+
+    # Assert
+    assert received.lot_id == info.lot_id
+    assert live == [True, False]
+
+
+class ScriptedFailoverClient(FailoverAuctionClient):
+    """Failover client with probe results set by test"""
+
+    probe_results: Dict[str, float]
+
+    async def _probe(self, client: AuctionClient) -> float:
+        return self.probe_results[client.url]
+
+
+@pytest.fixture
+def endpoint_urls(fake_server: MockAuctionServer) -> List[str]:
+    # Two names of the same server
+    return [fake_server.url, fake_server.url.replace("127.0.0.1", "localhost")]
+
+
+async def test_failover_client_skips_dead_endpoint(
+    fake_server: MockAuctionServer, info: SearcherInfo
+) -> None:
+    # Arrange
+    client = FailoverAuctionClient(["ws://127.0.0.1:1", fake_server.url], "token")
+
+    # Act
+    async with client:
+        fake_server.send_queue.put_nowait(
+            {"method": "user_transaction", "params": info_to_params(info)}
+        )
+        received = await asyncio.wait_for(client.listen_as_iter().__anext__(), 1)
+        active_url = client.active_url
+        rtt = client.endpoint_rtt
+
+    # Assert
+    assert received.lot_id == info.lot_id
+    assert active_url == fake_server.url
+    assert rtt["ws://127.0.0.1:1"] == float("inf")
+    assert 0 < rtt[fake_server.url] < 1
+
+
+async def test_failover_client_moves_to_faster_endpoint(
+    endpoint_urls: List[str],
+) -> None:
+    # Arrange
+    first, second = endpoint_urls
+    client = ScriptedFailoverClient(
+        endpoint_urls, "token", probe_interval=datetime.timedelta(seconds=0.01)
+    )
+    client.probe_results = {first: 0.001, second: 0.01}
+
+    # Act
+    async with client:
+        initial_url = client.active_url
+        client.probe_results = {first: 0.01, second: 0.001}
+        switched = await wait_for_condition(lambda: client.active_url == second, 1)
+
+    # Assert
+    assert initial_url == first
+    assert switched
+    assert client.failovers == 0
+
+
+async def test_failover_client_moves_on_broken_connection(
+    endpoint_urls: List[str],
+) -> None:
+    # Arrange
+    first, second = endpoint_urls
+    client = ScriptedFailoverClient(endpoint_urls, "token")
+    client.probe_results = {first: 0.001, second: 0.01}
+
+    # Act
+    async with client:
+        await client.clients[0]._queue.put(PingNotReceived("Connection lost"))
+        assert await wait_for_condition(lambda: client.active_url == second, 1)
+
+    # Assert
+    assert client.failovers == 1
+    assert client.endpoint_rtt[first] == float("inf")
@@ -0,0 +1,44 @@
+import pytest
+
+from searcher_sdk.clock import ClockOffsetEstimator, LocalClock
+
+
+def test_offset_from_fastest_round_trip() -> None:
+    # Arrange
+    estimator = ClockOffsetEstimator(clock=lambda: 1000.0)
+
+    # Act
+    estimator.record(sent=100.0, server_time=110.5, received=101.0)
+    estimator.record(sent=200.0, server_time=210.1, received=200.2)
+    estimator.record(sent=300.0, server_time=313.0, received=304.0)
+
+    # Assert
+    assert estimator.offset == pytest.approx(10.0)
+    assert estimator.now() == pytest.approx(1010.0)
+
+
+def test_old_samples_forgotten() -> None:
+    # Arrange
+    estimator = ClockOffsetEstimator(window=2)
+    estimator.record(sent=100.0, server_time=100.0, received=100.0)
+
+    # Act
+    estimator.record(sent=200.0, server_time=205.5, received=201.0)
+    estimator.record(sent=300.0, server_time=306.0, received=302.0)
+
+    # Assert
+    assert estimator.samples == 2
+    assert estimator.offset == pytest.approx(5.0)
+
+
+def test_no_samples_means_local_time() -> None:
+    # Arrange
+    estimator = ClockOffsetEstimator(clock=lambda: 42.0)
+    local = LocalClock(clock=lambda: 42.0)
+
+    # Act
+    local.record(sent=0.0, server_time=100.0, received=0.0)
+
+    # Assert
+    assert estimator.now() == 42.0
+    assert local.now() == 42.0
@@ -0,0 +1,57 @@
+from typing import Type
+
+import pytest
+
+from searcher_sdk.codec import JSONCodec, StdlibCodec, available_codecs, get_codec
+from searcher_sdk.jsonrpc import JSONRPCRequest
+from searcher_sdk.models import MakeBidParam
+
+from tests.helpers import BidDataFactory
+
+
+@pytest.fixture(params=list(available_codecs().values()))
+def codec(request: pytest.FixtureRequest) -> JSONCodec:
+    codec_class: Type[JSONCodec] = request.param
+    return codec_class()
+
+
+def test_codec_roundtrip(codec: JSONCodec) -> None:
+    # Arrange
+    obj = {"id": 1, "result": {"list": [1, "a", None, True], "nested": {"x": 1.5}}}
+
+    # Act
+    encoded = codec.dumps(obj)
+
+    # Assert
+    assert isinstance(encoded, str)
+    assert codec.loads(encoded) == obj
+    assert codec.loads(encoded.encode()) == obj
+
+
+def test_codec_dumps_model(codec: JSONCodec) -> None:
+    # Arrange
+    bid = BidDataFactory.build()
+    req = JSONRPCRequest(
+        id=1,
+        method="make_bid",
+        params=MakeBidParam(
+            lot_id="1",
+            searcher_request=bid.searcher_request,
+            searcher_signature=bid.searcher_signature,
+        ),
+    )
+
+    # Act
+    encoded = codec.dumps_model(req)
+
+    # Assert
+    assert JSONRPCRequest.model_validate(codec.loads(encoded)).id == 1
+    assert "searcherRequest" in codec.loads(encoded)["params"]
+
+
+def test_get_codec() -> None:
+    # Act & Assert
+    assert isinstance(get_codec("json"), StdlibCodec)
+    assert get_codec().name in available_codecs()
+    with pytest.raises(ValueError):
+        get_codec("unknown")
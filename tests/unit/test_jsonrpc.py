@@ -0,0 +1,380 @@
+import asyncio
+import datetime
+import json
+from typing import Any, AsyncIterator, Dict, List, Type, cast
+
+import pytest
+from websockets.legacy.client import WebSocketClientProtocol
+
+from searcher_sdk.jsonrpc import (
+    DispatchConfig,
+    JSONRPCCallError,
+    JSONRPCClient,
+    JSONRPCErrorResponse,
+    JSONRPCNotification,
+    JSONRPCRequest,
+    JSONRPCResponse,
+    MessageDecoder,
+    RequestTable,
+)
+from searcher_sdk.models import SearcherInfo
+from searcher_sdk.queues import OverflowPolicy
+
+from tests.helpers import SearcherInfoFactory, wait_for_condition
+
+
+class FakeWebSocket:
+    """In-memory stand-in for websocket connection"""
+
+    def __init__(self) -> None:
+        self.sent: List[Any] = []
+        self.incoming: "asyncio.Queue[str]" = asyncio.Queue()
+
+    async def send(self, data: str) -> None:
+        self.sent.append(json.loads(data))
+
+    async def recv(self) -> str:
+        return await self.incoming.get()
+
+    def push(self, message: Any) -> None:
+        self.incoming.put_nowait(json.dumps(message))
+
+
+@pytest.fixture
+def ws() -> FakeWebSocket:
+    return FakeWebSocket()
+
+
+@pytest.fixture
+async def client(ws: FakeWebSocket) -> AsyncIterator[JSONRPCClient]:
+    client = JSONRPCClient()
+    async with client.listen(cast(WebSocketClientProtocol, ws)):
+        yield client
+
+
+@pytest.mark.parametrize(
+    "message,expected_type",
+    [
+        ({"method": "user_transaction", "params": {"a": 1}}, JSONRPCNotification),
+        ({"method": "user_transaction"}, JSONRPCNotification),
+        ({"id": 1, "method": "quote", "params": {"a": 1}}, JSONRPCRequest),
+        ({"id": "abc", "result": "pong"}, JSONRPCResponse),
+        ({"id": "abc", "result": None}, JSONRPCResponse),
+        (
+            {"id": 1, "error": {"code": -32000, "message": "fail"}},
+            JSONRPCErrorResponse,
+        ),
+    ],
+)
+def test_decoder_routes_by_keys(
+    message: Dict[str, Any], expected_type: Type[Any]
+) -> None:
+    # Arrange
+    decoder = MessageDecoder()
+
+    # Act
+    decoded = decoder.decode(json.dumps({"jsonrpc": "2.0", **message}))
+
+    # Assert
+    assert [type(message) for message in decoded] == [expected_type]
+
+
+def test_decoder_batch_skips_invalid_members() -> None:
+    # Arrange
+    decoder = MessageDecoder()
+    raw = json.dumps([{"id": 1, "result": "pong"}, {"id": 2}, 42, {"method": "a"}])
+
+    # Act
+    decoded = decoder.decode(raw)
+
+    # Assert
+    expected: List[Type[Any]] = [JSONRPCResponse, JSONRPCNotification]
+    assert [type(message) for message in decoded] == expected
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "not a json",
+        "42",
+        "[]",
+        json.dumps({"jsonrpc": "2.0", "id": 1}),
+        json.dumps({"jsonrpc": "2.0", "id": 1, "error": {"code": "bad"}}),
+    ],
+)
+def test_decoder_rejects_invalid(raw: str) -> None:
+    # Arrange
+    decoder = MessageDecoder()
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        decoder.decode(raw)
+
+
+async def test_send_batch(ws: FakeWebSocket, client: JSONRPCClient) -> None:
+    # Arrange
+    info = SearcherInfoFactory.build()
+
+    # Act
+    futures = await client.send_batch([("ping", None), ("echo", info)])
+    batch = ws.sent[0]
+    ws.push([{"id": req["id"], "result": req["method"]} for req in reversed(batch)])
+    results = await asyncio.gather(*futures)
+
+    # Assert
+    assert client.pending_requests == 0
+    assert len(ws.sent) == 1
+    assert [req["method"] for req in batch] == ["ping", "echo"]
+    assert SearcherInfo(**batch[1]["params"]) == info
+    assert results == ["ping", "echo"]
+
+
+async def test_batch_notifications_received(
+    ws: FakeWebSocket, client: JSONRPCClient
+) -> None:
+    # Arrange
+    received: List[SearcherInfo] = []
+    infos = SearcherInfoFactory.batch(3)
+
+    @client.on_notification("user_transaction")
+    async def on_lot(info: SearcherInfo) -> None:
+        received.append(info)
+
+    # Act
+    ws.push(
+        [
+            {"method": "user_transaction", "params": info.model_dump(by_alias=True)}
+            for info in infos
+        ]
+    )
+
+    # Assert
+    assert await wait_for_condition(lambda: len(received) == 3)
+    assert received == infos
+
+
+async def test_error_response_fails_request(
+    ws: FakeWebSocket, client: JSONRPCClient
+) -> None:
+    # Arrange
+    task = asyncio.create_task(client.send_request("make_bid"))
+    assert await wait_for_condition(lambda: bool(ws.sent))
+
+    # Act
+    ws.push(
+        {
+            "id": ws.sent[0]["id"],
+            "error": {"code": -32000, "message": "Bid rejected", "data": {"a": 1}},
+        }
+    )
+
+    # Assert
+    with pytest.raises(JSONRPCCallError) as exc_info:
+        await asyncio.wait_for(task, timeout=1)
+    assert exc_info.value.code == -32000
+    assert exc_info.value.message == "Bid rejected"
+    assert exc_info.value.data == {"a": 1}
+
+
+async def test_response_for_unknown_id_ignored(
+    ws: FakeWebSocket, client: JSONRPCClient
+) -> None:
+    # Arrange
+    task = asyncio.create_task(client.send_request("ping"))
+    assert await wait_for_condition(lambda: bool(ws.sent))
+
+    # Act
+    ws.push({"id": "unknown", "result": "pong"})
+    ws.push({"id": "unknown", "error": {"code": -32000, "message": "fail"}})
+    ws.push({"id": ws.sent[0]["id"], "result": "pong"})
+
+    # Assert
+    assert await asyncio.wait_for(task, timeout=1) == "pong"
+
+
+async def test_request_ids_are_monotonic(
+    ws: FakeWebSocket, client: JSONRPCClient
+) -> None:
+    # Act
+    futures = await client.send_batch([("ping", None)] * 3)
+    for future in futures:
+        future.cancel()
+
+    # Assert
+    assert [req["id"] for req in ws.sent[0]] == [1, 2, 3]
+
+
+async def test_timed_out_requests_removed() -> None:
+    # Arrange
+    ws = FakeWebSocket()
+    client = JSONRPCClient(response_timeout=datetime.timedelta(seconds=0.01))
+
+    # Act
+    async with client.listen(cast(WebSocketClientProtocol, ws)):
+        with pytest.raises(asyncio.TimeoutError):
+            await client.send_request("ping")
+        futures = await client.send_batch([("ping", None), ("ping", None)])
+        await asyncio.wait(futures)
+
+    # Assert
+    assert client.pending_requests == 0
+
+
+async def test_per_call_timeout(ws: FakeWebSocket, client: JSONRPCClient) -> None:
+    # Arrange
+    loop = asyncio.get_event_loop()
+    started = loop.time()
+
+    # Act
+    with pytest.raises(asyncio.TimeoutError):
+        await client.send_request("ping", timeout=0.01)
+
+    # Assert
+    assert loop.time() - started < client.response_timeout
+    assert client.pending_requests == 0
+
+
+async def test_cancelled_request_removed(
+    ws: FakeWebSocket, client: JSONRPCClient
+) -> None:
+    # Arrange
+    task = asyncio.create_task(client.send_request("ping"))
+    assert await wait_for_condition(lambda: client.pending_requests == 1)
+
+    # Act
+    task.cancel()
+    await asyncio.wait([task])
+
+    # Assert
+    assert client.pending_requests == 0
+
+
+async def test_request_table_fail_all() -> None:
+    # Arrange
+    table = RequestTable()
+    _, future = table.create()
+
+    # Act
+    table.fail_all(ConnectionError())
+
+    # Assert
+    assert len(table) == 0
+    assert isinstance(future.exception(), ConnectionError)
+
+
+async def test_responses_not_queued_behind_notifications() -> None:
+    # Arrange
+    ws = FakeWebSocket()
+    client = JSONRPCClient(dispatch=DispatchConfig(max_in_flight=1, queue_size=10))
+    handler_release = asyncio.Event()
+
+    @client.on_notification("slow")
+    async def slow(_: None) -> None:
+        await handler_release.wait()
+
+    # Act
+    async with client.listen(cast(WebSocketClientProtocol, ws)):
+        task = asyncio.create_task(client.send_request("ping"))
+        assert await wait_for_condition(lambda: bool(ws.sent))
+        for _ in range(3):
+            ws.push({"method": "slow"})
+        ws.push({"id": ws.sent[0]["id"], "result": "pong"})
+        result = await asyncio.wait_for(task, timeout=1)
+        queued = client.queued_messages
+        handler_release.set()
+
+    # Assert
+    assert result == "pong"
+    assert queued == 2
+
+
+async def test_dispatch_overflow_drops_notifications() -> None:
+    # Arrange
+    ws = FakeWebSocket()
+    client = JSONRPCClient(
+        dispatch=DispatchConfig(
+            max_in_flight=1, queue_size=2, overflow=OverflowPolicy.DROP_NEWEST
+        )
+    )
+    handler_release = asyncio.Event()
+    started: List[SearcherInfo] = []
+    received: List[SearcherInfo] = []
+    infos = SearcherInfoFactory.batch(5)
+
+    @client.on_notification("user_transaction")
+    async def on_lot(info: SearcherInfo) -> None:
+        started.append(info)
+        await handler_release.wait()
+        received.append(info)
+
+    # Act
+    async with client.listen(cast(WebSocketClientProtocol, ws)):
+        for i, info in enumerate(infos):
+            ws.push(
+                {"method": "user_transaction", "params": info.model_dump(by_alias=True)}
+            )
+            if i == 0:
+                # Let the only worker pick the first lot up
+                assert await wait_for_condition(lambda: bool(started))
+        assert await wait_for_condition(lambda: client.dropped_messages == 2)
+        handler_release.set()
+        assert await wait_for_condition(lambda: len(received) == 3)
+
+    # Assert
+    assert client.dropped_messages == 2
+    assert received == infos[:3]
+
+
+async def test_request_handled(ws: FakeWebSocket, client: JSONRPCClient) -> None:
+    # Arrange
+    info = SearcherInfoFactory.build()
+
+    @client.on_request("quote")
+    async def quote(info: SearcherInfo) -> SearcherInfo:
+        return info
+
+    # Act
+    ws.push({"id": 7, "method": "quote", "params": info.model_dump(by_alias=True)})
+
+    # Assert
+    assert await wait_for_condition(lambda: bool(ws.sent))
+    assert ws.sent[0]["id"] == 7
+    assert SearcherInfo(**ws.sent[0]["result"]) == info
+
+
+@pytest.mark.parametrize(
+    "method,params,expected_code",
+    [
+        ("unknown", None, -32601),
+        ("quote", {"wrong": "params"}, -32602),
+        ("rejecting", None, 42),
+        ("failing", None, -32000),
+    ],
+)
+async def test_request_errors(
+    ws: FakeWebSocket,
+    client: JSONRPCClient,
+    method: str,
+    params: Any,
+    expected_code: int,
+) -> None:
+    # Arrange
+    @client.on_request("quote")
+    async def quote(info: SearcherInfo) -> None:
+        pass
+
+    @client.on_request("rejecting")
+    async def rejecting(_: None) -> None:
+        raise JSONRPCCallError(code=42, message="rejected")
+
+    @client.on_request("failing")
+    async def failing(_: None) -> None:
+        raise RuntimeError("failed")
+
+    # Act
+    ws.push({"id": "req", "method": method, "params": params})
+
+    # Assert
+    assert await wait_for_condition(lambda: bool(ws.sent))
+    assert ws.sent[0]["id"] == "req"
+    assert ws.sent[0]["error"]["code"] == expected_code
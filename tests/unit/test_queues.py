@@ -0,0 +1,185 @@
+import asyncio
+from typing import List, Optional, Union
+
+import pytest
+
+from searcher_sdk.models import SearcherInfo
+from searcher_sdk.queues import (
+    BoundedQueue,
+    LotQueue,
+    LotQueueConfig,
+    LotQueueStats,
+    OverflowPolicy,
+    Scheduling,
+)
+
+from tests.helpers import SearcherInfoFactory
+
+NOW = 1000
+
+
+def _lot(min_deadline: Optional[int]) -> SearcherInfo:
+    return SearcherInfoFactory.build(min_deadline=min_deadline)
+
+
+async def _drain(queue: BoundedQueue[int]) -> List[int]:
+    return [queue.get_nowait() for _ in range(queue.qsize())]
+
+
+@pytest.mark.parametrize(
+    "overflow,expected",
+    [
+        (OverflowPolicy.DROP_OLDEST, [3, 4]),
+        (OverflowPolicy.DROP_NEWEST, [1, 2]),
+    ],
+)
+async def test_bounded_queue_drops(
+    overflow: OverflowPolicy, expected: List[int]
+) -> None:
+    # Arrange
+    queue: BoundedQueue[int] = BoundedQueue(2, overflow)
+
+    # Act
+    for item in range(1, 5):
+        await queue.put(item)
+
+    # Assert
+    assert queue.dropped == 2
+    assert await _drain(queue) == expected
+
+
+async def test_bounded_queue_blocks() -> None:
+    # Arrange
+    queue: BoundedQueue[int] = BoundedQueue(1, OverflowPolicy.BLOCK)
+    await queue.put(1)
+
+    # Act
+    put_task = asyncio.create_task(queue.put(2))
+    await asyncio.sleep(0.01)
+    blocked = not put_task.done()
+    first = await queue.get()
+    await asyncio.wait_for(put_task, timeout=1)
+
+    # Assert
+    assert blocked
+    assert first == 1
+    assert queue.dropped == 0
+    assert await _drain(queue) == [2]
+
+
+async def test_lot_queue_drops_expired_on_get() -> None:
+    # Arrange
+    queue: LotQueue[SearcherInfo] = LotQueue(
+        LotQueueConfig(drop_expired=True), clock=lambda: NOW
+    )
+    lots = [_lot(NOW - 1), _lot(None), _lot(NOW), _lot(NOW + 1)]
+    for lot in lots:
+        await queue.put(lot)
+
+    # Act
+    received = [await queue.get(), await queue.get()]
+
+    # Assert
+    assert received == [lots[1], lots[3]]
+    assert queue.stats.expired == 2
+    assert queue.empty()
+
+
+async def test_lot_queue_keeps_expired_by_default() -> None:
+    # Arrange
+    queue: LotQueue[SearcherInfo] = LotQueue(clock=lambda: NOW)
+    lot = _lot(NOW - 1)
+    await queue.put(lot)
+
+    # Act
+    received = await queue.get()
+
+    # Assert
+    assert received == lot
+    assert queue.stats.expired == 0
+
+
+async def test_lot_queue_purges_expired_before_evicting() -> None:
+    # Arrange
+    stats = LotQueueStats()
+    queue: LotQueue[SearcherInfo] = LotQueue(
+        LotQueueConfig(
+            maxsize=3, overflow=OverflowPolicy.DROP_OLDEST, drop_expired=True
+        ),
+        stats=stats,
+        clock=lambda: NOW,
+    )
+    fresh = [_lot(NOW + 10) for _ in range(4)]
+
+    # Act
+    for lot in [fresh[0], _lot(NOW - 1), fresh[1], fresh[2], fresh[3]]:
+        await queue.put(lot)
+
+    # Assert
+    assert stats.expired == 1
+    assert stats.evicted == 1
+    assert [queue.get_nowait() for _ in range(3)] == fresh[1:]
+
+
+async def test_lot_queue_never_drops_errors() -> None:
+    # Arrange
+    queue: LotQueue[Union[SearcherInfo, Exception]] = LotQueue(
+        LotQueueConfig(maxsize=1, overflow=OverflowPolicy.DROP_NEWEST)
+    )
+    await queue.put(_lot(None))
+
+    # Act
+    await queue.put(ConnectionError())
+
+    # Assert
+    assert isinstance(await queue.get(), ConnectionError)
+    assert queue.stats.evicted == 1
+
+
+async def test_lot_queue_edf_order() -> None:
+    # Arrange
+    queue: LotQueue[Union[SearcherInfo, Exception]] = LotQueue(
+        LotQueueConfig(scheduling=Scheduling.EDF)
+    )
+    lots = [_lot(NOW + 5), _lot(None), _lot(NOW + 1), _lot(NOW + 5), _lot(NOW + 3)]
+    for lot in lots:
+        await queue.put(lot)
+    error = ConnectionError()
+    await queue.put(error)
+
+    # Act
+    received = [await queue.get() for _ in range(6)]
+
+    # Assert
+    assert received == [error, lots[2], lots[4], lots[0], lots[3], lots[1]]
+
+
+async def test_lot_queue_edf_evicts_first_arrived() -> None:
+    # Arrange
+    queue: LotQueue[SearcherInfo] = LotQueue(
+        LotQueueConfig(
+            maxsize=2, overflow=OverflowPolicy.DROP_OLDEST, scheduling=Scheduling.EDF
+        )
+    )
+    lots = [_lot(NOW + 5), _lot(NOW + 1), _lot(NOW + 3)]
+
+    # Act
+    for lot in lots:
+        await queue.put(lot)
+
+    # Assert
+    assert queue.stats.evicted == 1
+    assert [queue.get_nowait() for _ in range(2)] == [lots[1], lots[2]]
+
+
+async def test_lot_queue_get_nowait_drops_expired() -> None:
+    # Arrange
+    queue: LotQueue[SearcherInfo] = LotQueue(
+        LotQueueConfig(drop_expired=True), clock=lambda: NOW
+    )
+    await queue.put(_lot(NOW - 1))
+
+    # Act & Assert
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+    assert queue.stats.expired == 1
@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import List
+
+from searcher_sdk.supervisor import LotSupervisor
+
+
+async def test_concurrency_is_bounded() -> None:
+    # Arrange
+    supervisor = LotSupervisor(concurrency=2)
+    running: List[int] = []
+    peak = 0
+
+    async def work() -> None:
+        nonlocal peak
+        running.append(1)
+        peak = max(peak, len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+
+    # Act
+    for _ in range(6):
+        await supervisor.submit(None, work)
+        assert supervisor.in_flight <= 2
+    await supervisor.drain(timeout=1)
+
+    # Assert
+    assert peak == 2
+    assert supervisor.in_flight == 0
+
+
+async def test_task_cancelled_after_deadline() -> None:
+    # Arrange
+    supervisor = LotSupervisor()
+    finished = False
+
+    async def work() -> None:
+        nonlocal finished
+        await asyncio.sleep(1)
+        finished = True
+
+    # Act
+    task = await supervisor.submit(time.time() + 0.01, work)
+    await task
+
+    # Assert
+    assert not finished
+    assert supervisor.timed_out == 1
+
+
+async def test_drain_cancels_unfinished_tasks() -> None:
+    # Arrange
+    supervisor = LotSupervisor(concurrency=2)
+    finished: List[float] = []
+
+    async def work(duration: float) -> None:
+        await asyncio.sleep(duration)
+        finished.append(duration)
+
+    await supervisor.submit(None, lambda: work(0))
+    await supervisor.submit(None, lambda: work(10))
+
+    # Act
+    await supervisor.drain(timeout=0.05)
+
+    # Assert
+    assert finished == [0]
+    assert supervisor.in_flight == 0
@@ -0,0 +1,71 @@
+from searcher_sdk.telemetry import AdaptivePingInterval, RttHistogram, TimeoutPolicy
+
+
+def test_rtt_histogram_percentiles() -> None:
+    # Arrange
+    rtt = RttHistogram(window=100)
+
+    # Act
+    for i in range(1, 201):
+        rtt.record(i / 1000)
+
+    # Assert
+    assert len(rtt) == 100
+    assert rtt.count == 200
+    assert rtt.last == 0.2
+    assert rtt.p50 == 0.15
+    assert rtt.p99 == 0.199
+
+
+def test_rtt_histogram_empty() -> None:
+    # Arrange
+    rtt = RttHistogram()
+
+    # Act & Assert
+    assert rtt.last is None
+    assert rtt.p50 is None
+    assert rtt.p99 is None
+
+
+def test_ping_interval_adapts_to_degraded_rtt() -> None:
+    # Arrange
+    rtt = RttHistogram()
+    interval = AdaptivePingInterval(minimum=1, maximum=8)
+    for _ in range(10):
+        rtt.record(0.01)
+
+    # Act
+    stable = interval.next(rtt)
+    rtt.record(0.1)
+    degraded = interval.next(rtt)
+    rtt.record(0.01)
+    recovering = [interval.next(rtt) for _ in range(4)]
+
+    # Assert
+    assert stable == 8
+    assert degraded == 1
+    assert recovering == [2, 4, 8, 8]
+
+
+def test_timeout_policy() -> None:
+    # Arrange
+    policy = TimeoutPolicy(multiplier=4, floor=0.25, ceiling=5, min_samples=3)
+    rtt = RttHistogram()
+
+    # Act
+    rtt.record(0.1)
+    warming_up = policy.timeout(rtt)
+    rtt.record(0.1)
+    rtt.record(0.1)
+    measured = policy.timeout(rtt)
+    rtt.record(0.01)
+    fast = policy.timeout(rtt)
+    for _ in range(10):
+        rtt.record(10)
+    slow = policy.timeout(rtt)
+
+    # Assert
+    assert warming_up is None
+    assert measured == 0.4
+    assert fast == 0.4
+    assert slow == 5
@@ -2,7 +2,7 @@ import secrets
 from datetime import datetime
 
 from searcher_sdk.models import SearcherInfo, SearcherRequest, SignatureDomainInfo, Txn
-from searcher_sdk.utils import sign_searcher_request, user_tx_hash
+from searcher_sdk.utils import Backoff, sign_searcher_request, user_tx_hash
 
 
 def _make_random_addr() -> str:
@@ -71,3 +71,16 @@ def test_sign_req() -> None:
 
     # TODO: use same private key and validate signature
     assert signature
+
+
+def test_backoff_delay() -> None:
+    # Arrange
+    backoff = Backoff(initial=1, maximum=10, multiplier=2, jitter=0.5)
+
+    # Act
+    delays = [backoff.delay(attempt) for attempt in range(6)]
+
+    # Assert
+    for delay, expected_max in zip(delays, [1, 2, 4, 8, 10, 10]):
+        assert expected_max / 2 <= delay <= expected_max
+    assert backoff.delay(100_000) <= 10